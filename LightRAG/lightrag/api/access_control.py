@@ -10,21 +10,90 @@ This module centralizes:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+import logging
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Optional
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional
 
+import orjson
 from fastapi import HTTPException, Security, status
 from fastapi.security import OAuth2PasswordBearer
 
 from lightrag.base import DocProcessingStatus, DocStatus, QueryParam
 from lightrag.constants import GRAPH_FIELD_SEP
+from lightrag.utils import logger, substring_alternation
 
 from .auth import auth_handler
+from .config import global_args
 
 # Reuse existing OAuth2 scheme (optional auth)
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="login", auto_error=False)
 
+# Validated tokens are cached briefly so signature verification is not repeated
+# on every request carrying the same bearer token.
+TOKEN_CACHE_MAXSIZE = 4096
+TOKEN_CACHE_TTL_SECONDS = 60.0
+
+# Documents are evaluated in batches of this size; full batches are moved off
+# the event loop
+ACCESS_FILTER_THREAD_THRESHOLD = 2000
+
+# Roles granted VIEW on every document (GLOBAL_VIEW_ROLES)
+GLOBAL_VIEW_ROLES = frozenset(
+    role.strip() for role in global_args.global_view_roles.split(",") if role.strip()
+)
+
+# get_user_accessible_files results are reused briefly for identical calls;
+# document writes bump the version (see invalidate_accessible_files_cache)
+ACCESSIBLE_FILES_CACHE_MAXSIZE = 1024
+ACCESSIBLE_FILES_CACHE_TTL_SECONDS = 30.0
+
+
+class TTLCache:
+    """Small bounded LRU cache whose entries expire after a time-to-live.
+
+    Reads and writes are not guarded by a lock: callers run on the event loop
+    thread and individual dict operations are atomic under the GIL.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
 
 class Permission(str, Enum):
     """Supported permission levels extracted from share metadata."""
@@ -35,11 +104,20 @@ class Permission(str, Enum):
     @classmethod
     def from_value(cls, value: str) -> "Permission":
         try:
-            return cls(value.lower())
-        except ValueError as exc:
+            return _PERMISSION_LOOKUP[value.lower()]
+        except KeyError as exc:
             raise ValueError(f"Unsupported permission '{value}'") from exc
 
 
+# Lowercase value -> member map used by Permission.from_value
+_PERMISSION_LOOKUP: Dict[str, Permission] = {member.value: member for member in Permission}
+
+
+# Share identifiers that grant access to every user (or every role)
+_WILDCARD_IDENTIFIERS = frozenset({"all", "*"})
+_VALID_TARGET_TYPES = frozenset({"user", "role"})
+
+
 @dataclass(frozen=True)
 class ShareEntry:
     """Represents a single share rule in the metadata."""
@@ -48,22 +126,27 @@ class ShareEntry:
     permission: Permission
     identifier: str
 
+    def __post_init__(self) -> None:
+        # Intern the string fields: the same targets recur across many documents,
+        # so dedupe hashing and equality checks hit the identity fast path.
+        # Identifiers may arrive as non-strings (e.g. numeric user ids from JWT
+        # metadata), so they are coerced first.
+        object.__setattr__(self, "target_type", sys.intern(str(self.target_type)))
+        object.__setattr__(self, "identifier", sys.intern(str(self.identifier)))
+        # Precompute wildcard detection once; entries are evaluated per document
+        object.__setattr__(self, "_wildcard", self.identifier.lower() in _WILDCARD_IDENTIFIERS)
+
     def matches_user(self, user_id: Optional[str], user_roles: Iterable[str]) -> bool:
         """Check whether this entry targets the given user or any of their roles.
         
         Supports wildcards: 'all' or '*' in user target_type matches any authenticated user.
+        Pass ``user_roles`` as a set/frozenset for O(1) role membership checks.
         """
 
         if self.target_type == "user" and user_id:
-            # Support wildcards for "all users"
-            if self.identifier.lower() in ("all", "*"):
-                return True
-            return self.identifier == user_id
+            return self._wildcard or self.identifier == user_id
         if self.target_type == "role":
-            # Support wildcards for "all roles"
-            if self.identifier.lower() in ("all", "*"):
-                return True
-            return self.identifier in user_roles
+            return self._wildcard or self.identifier in user_roles
         return False
 
     def allows(self, required: Permission) -> bool:
@@ -84,28 +167,137 @@ class ShareEntry:
         return f"{self.target_type}:{self.permission.value}:{self.identifier}"
 
 
-@dataclass
+# Read-only stand-in for documents without metadata
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+# Key standing in for wildcard identifiers inside ShareIndex sets
+_WILDCARD_KEY = "*"
+
+
+@dataclass(frozen=True)
+class ShareIndex:
+    """Share entries of one document grouped for O(1) permission checks.
+
+    View sets also contain edit-level identifiers (edit implies view), and
+    wildcard entries ('all' / '*') are stored under a single ``"*"`` key.
+    """
+
+    entries: tuple[ShareEntry, ...] = ()
+    view_user_ids: frozenset[str] = frozenset()
+    view_role_ids: frozenset[str] = frozenset()
+    edit_user_ids: frozenset[str] = frozenset()
+    edit_role_ids: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[ShareEntry]) -> "ShareIndex":
+        entries = tuple(entries)
+        groups: Dict[tuple[str, Permission], set[str]] = {
+            ("user", Permission.VIEW): set(),
+            ("role", Permission.VIEW): set(),
+            ("user", Permission.EDIT): set(),
+            ("role", Permission.EDIT): set(),
+        }
+        for entry in entries:
+            if entry.target_type not in ("user", "role"):
+                continue
+            key = _WILDCARD_KEY if entry._wildcard else entry.identifier
+            groups[(entry.target_type, Permission.VIEW)].add(key)
+            if entry.permission == Permission.EDIT:
+                groups[(entry.target_type, Permission.EDIT)].add(key)
+        return cls(
+            entries=entries,
+            view_user_ids=frozenset(groups[("user", Permission.VIEW)]),
+            view_role_ids=frozenset(groups[("role", Permission.VIEW)]),
+            edit_user_ids=frozenset(groups[("user", Permission.EDIT)]),
+            edit_role_ids=frozenset(groups[("role", Permission.EDIT)]),
+        )
+
+    def grants(
+        self, user_id: Optional[str], user_roles: frozenset[str], required: Permission
+    ) -> bool:
+        """Equivalent to any(entry.matches_user(...) and entry.allows(required))."""
+
+        if required == Permission.EDIT:
+            user_ids, role_ids = self.edit_user_ids, self.edit_role_ids
+        else:
+            user_ids, role_ids = self.view_user_ids, self.view_role_ids
+        if user_id and (_WILDCARD_KEY in user_ids or user_id in user_ids):
+            return True
+        return _WILDCARD_KEY in role_ids or not role_ids.isdisjoint(user_roles)
+
+
+@dataclass(frozen=True)
 class AccessFilters:
-    """Query-time access filters supplied by the caller."""
+    """Query-time access filters supplied by the caller.
+
+    Instances are cached and shared between requests, so they are immutable:
+    tags are stored as a tuple of read-only mappings.
+    """
 
     project_id: Optional[str] = None
     owner: Optional[str] = None
-    tags: List[Dict[str, str]] = field(default_factory=list)
+    tags: tuple[Mapping[str, str], ...] = ()
     filename: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "tags",
+            tuple(MappingProxyType(dict(tag)) for tag in self.tags or ()),
+        )
+
+    @cached_property
+    def tag_keys(self) -> frozenset[tuple[Any, Any]]:
+        """(name, value) pairs every matching document must carry."""
+
+        return frozenset(
+            (tag.get("name"), tag.get("value", "")) for tag in self.tags
+        )
+
+    @cached_property
+    def is_empty(self) -> bool:
+        """True when no filter is set, so every document passes."""
+
+        return not (self.project_id or self.owner or self.tags or self.filename)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-ready copy of the filter fields (without the cached properties)."""
+
+        return {
+            "project_id": self.project_id,
+            "owner": self.owner,
+            "tags": [dict(tag) for tag in self.tags],
+            "filename": self.filename,
+        }
+
 
 class CurrentUser:
     """
     Container for current user information extracted from JWT token
-    
+
+    Instances are shared between requests carrying the same token, so they are
+    treated as read-only once constructed.
+
     Attributes:
         username: Username from token
         user_id: Unique user identifier (from metadata or username)
         role: User role (e.g., "user", "admin", "guest")
         metadata: Additional metadata from token
         is_authenticated: Whether user has valid authentication
+        roles: Normalized tuple of all roles granted to the user (first-seen order)
+        role_set: Frozenset of ``roles`` for O(1) membership checks
     """
-    
+
+    __slots__ = (
+        "username",
+        "user_id",
+        "role",
+        "metadata",
+        "is_authenticated",
+        "roles",
+        "role_set",
+    )
+
     def __init__(
         self,
         username: Optional[str] = None,
@@ -131,7 +323,8 @@ class CurrentUser:
             role_values.extend([str(r) for r in token_roles])
         elif isinstance(token_roles, str):
             role_values.append(token_roles)
-        self.roles = sorted({r for r in role_values if r})
+        self.roles = tuple(dict.fromkeys(r for r in role_values if r))
+        self.role_set = frozenset(self.roles)
 
     def has_role(self, role: str) -> bool:
         """
@@ -143,12 +336,79 @@ class CurrentUser:
         Returns:
             True if user has the role
         """
-        return role == self.role or role in self.roles
+        return role == self.role or role in self.role_set
+
+    def has_global_permission(self, permission: Permission) -> bool:
+        """
+        Check if the user holds ``permission`` on every document
+
+        Only VIEW can be granted globally, through GLOBAL_VIEW_ROLES.
+        """
+        return (
+            self.is_authenticated
+            and permission == Permission.VIEW
+            and not self.role_set.isdisjoint(GLOBAL_VIEW_ROLES)
+        )
 
     def __repr__(self):
         return f"CurrentUser(user_id={self.user_id}, role={self.role}, authenticated={self.is_authenticated})"
 
 
+_accessible_files_cache = TTLCache(
+    maxsize=ACCESSIBLE_FILES_CACHE_MAXSIZE, ttl=ACCESSIBLE_FILES_CACHE_TTL_SECONDS
+)
+_doc_status_version = 0
+# Scans currently running for a cache key, shared by concurrent callers
+_accessible_files_inflight: dict[Hashable, asyncio.Future] = {}
+
+
+def invalidate_accessible_files_cache() -> None:
+    """Drop cached access results after documents were added, changed or removed."""
+
+    global _doc_status_version
+    _doc_status_version += 1
+    _accessible_files_cache.clear()
+
+
+# Shared instance returned for requests without a (valid) token
+_GUEST_USER = CurrentUser(is_authenticated=False, role="guest")
+
+_token_user_cache = TTLCache(maxsize=TOKEN_CACHE_MAXSIZE, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+
+def resolve_token_user(token: str) -> CurrentUser:
+    """Validate a JWT token and return the matching authenticated CurrentUser.
+
+    The built user is cached per token so repeated requests skip both signature
+    verification and role normalization. Entries never outlive the token's own
+    ``exp`` claim. Invalid tokens are not cached, so ``auth_handler.validate_token``
+    keeps raising for them.
+    """
+
+    cached_user = _token_user_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+
+    token_info = auth_handler.validate_token(token)
+
+    # token_info = {"username": str, "role": str, "metadata": dict, "exp": datetime}
+    token_metadata = token_info.get("metadata", {})
+    user = CurrentUser(
+        username=token_info.get("username"),
+        user_id=token_metadata.get("user_id") or token_info.get("username"),
+        role=token_info.get("role", "user"),
+        metadata=token_metadata,
+        is_authenticated=True,
+        roles=token_metadata.get("roles"),
+    )
+
+    expire_time = token_info.get("exp")
+    if isinstance(expire_time, datetime):
+        remaining = (expire_time - datetime.utcnow()).total_seconds()
+        _token_user_cache.set(token, user, ttl=remaining)
+    return user
+
+
 async def get_current_user_optional(
     token: Optional[str] = Security(oauth2_scheme_optional)
 ) -> CurrentUser:
@@ -175,26 +435,14 @@ async def get_current_user_optional(
     """
     # No token provided - unauthenticated user
     if not token:
-        return CurrentUser(is_authenticated=False, role="guest")
+        return _GUEST_USER
     
     try:
-        # Use existing auth_handler to validate token
-        token_info = auth_handler.validate_token(token)
-        
-        # Extract user information from token
-        # token_info = {"username": str, "role": str, "metadata": dict, "exp": datetime}
-        return CurrentUser(
-            username=token_info.get("username"),
-            user_id=token_info.get("metadata", {}).get("user_id") or token_info.get("username"),
-            role=token_info.get("role", "user"),
-            metadata=token_info.get("metadata", {}),
-            is_authenticated=True,
-            roles=token_info.get("metadata", {}).get("roles"),
-        )
-        
+        # Use existing auth_handler to validate token (cached per token)
+        return resolve_token_user(token)
     except Exception:
         # Invalid token - treat as unauthenticated (don't raise error for optional auth)
-        return CurrentUser(is_authenticated=False, role="guest")
+        return _GUEST_USER
 
 
 async def get_current_user_required(
@@ -228,23 +476,56 @@ async def get_current_user_required(
         )
     
     # Validate token (will raise HTTPException if invalid)
-    token_info = auth_handler.validate_token(token)
-    
-    # Extract user information
-    return CurrentUser(
-        username=token_info.get("username"),
-        user_id=token_info.get("metadata", {}).get("user_id") or token_info.get("username"),
-        role=token_info.get("role", "user"),
-        metadata=token_info.get("metadata", {}),
-        is_authenticated=True,
-        roles=token_info.get("metadata", {}).get("roles"),
-    )
+    return resolve_token_user(token)
 
 
 # ---------------------------------------------------------------------------
 # Metadata normalization helpers
 # ---------------------------------------------------------------------------
 
+def _coerce_tag_entry(entry: Any) -> Optional[tuple[str, str]]:
+    if entry is None:
+        return None
+    if isinstance(entry, dict):
+        name = str(entry.get("name", "")).strip()
+        value = str(entry.get("value", "")).strip()
+    elif isinstance(entry, str):
+        parts = entry.split(":", 1)
+        name = parts[0].strip()
+        value = parts[1].strip() if len(parts) == 2 else ""
+    else:
+        return None
+    if not name:
+        return None
+    # Tag vocabularies repeat across documents; interned strings make the
+    # dedupe keys and downstream tag lookups compare by identity
+    return sys.intern(name), sys.intern(value)
+
+
+def _unique_tag_pairs(raw_iterable: Iterable[Any]) -> tuple[tuple[str, str], ...]:
+    """Coerce entries to (name, value) pairs, dropping invalid ones and duplicates."""
+
+    # dict.fromkeys deduplicates while preserving order
+    return tuple(dict.fromkeys(filter(None, map(_coerce_tag_entry, raw_iterable))))
+
+
+@lru_cache(maxsize=4096)
+def _parse_tag_string(raw_str: str) -> tuple[tuple[str, str], ...]:
+    """Parse a JSON array or comma separated tag string.
+
+    Query strings recur across requests, so results are memoized; the returned
+    tuples are immutable and safe to share.
+    """
+
+    if not raw_str:
+        return ()
+    try:
+        parsed = orjson.loads(raw_str)
+    except (orjson.JSONDecodeError, TypeError):
+        parsed = [item.strip() for item in raw_str.split(",") if item.strip()]
+    return _unique_tag_pairs(parsed if isinstance(parsed, list) else [parsed])
+
+
 def normalize_tag_items(raw_tags: Any) -> List[Dict[str, str]]:
     """Normalize user-supplied tag payload into a list of name/value dicts.
 
@@ -259,70 +540,38 @@ def normalize_tag_items(raw_tags: Any) -> List[Dict[str, str]]:
     if raw_tags is None or raw_tags == "":
         return []
 
-    def _coerce_entry(entry: Any) -> Optional[Dict[str, str]]:
-        if entry is None:
-            return None
-        if isinstance(entry, dict):
-            name = str(entry.get("name", "")).strip()
-            value = str(entry.get("value", "")).strip()
-            if not name:
-                return None
-            return {"name": name, "value": value}
-        if isinstance(entry, str):
-            parts = entry.split(":", 1)
-            name = parts[0].strip()
-            value = parts[1].strip() if len(parts) == 2 else ""
-            if not name:
-                return None
-            return {"name": name, "value": value}
-        return None
-
-    normalized: List[Dict[str, str]] = []
-
     if isinstance(raw_tags, str):
-        raw_str = raw_tags.strip()
-        if not raw_str:
-            return []
-        try:
-            import json
-
-            parsed = json.loads(raw_str)
-        except (json.JSONDecodeError, TypeError):
-            parsed = [item.strip() for item in raw_str.split(",") if item.strip()]
-        raw_iterable = parsed if isinstance(parsed, list) else [parsed]
+        pairs = _parse_tag_string(raw_tags.strip())
     elif isinstance(raw_tags, dict):
-        raw_iterable = [{"name": k, "value": v} for k, v in raw_tags.items()]
+        pairs = _unique_tag_pairs(
+            {"name": k, "value": v} for k, v in raw_tags.items()
+        )
     else:
-        raw_iterable = raw_tags
-
-    for entry in raw_iterable:
-        coerced = _coerce_entry(entry)
-        if coerced:
-            normalized.append(coerced)
-
-    # Deduplicate while preserving order
-    seen = set()
-    unique: List[Dict[str, str]] = []
-    for item in normalized:
-        key = (item["name"], item["value"])
-        if key not in seen:
-            seen.add(key)
-            unique.append(item)
+        pairs = _unique_tag_pairs(raw_tags)
 
-    return unique
+    # Fresh dicts on every call so callers may mutate the result
+    return [{"name": name, "value": value} for name, value in pairs]
 
 
 def parse_share_entry(entry: str) -> ShareEntry:
     """Parse a colon-delimited share entry string."""
 
-    parts = [part.strip() for part in entry.split(":") if part.strip()]
-    if len(parts) != 3:
-        raise ValueError(
-            "Share entries must follow 'target_type:permission:identifier' format"
-        )
-    target_type, permission_raw, identifier = parts
+    target_type, _, rest = entry.partition(":")
+    permission_raw, _, identifier = rest.partition(":")
+    target_type = target_type.strip()
+    permission_raw = permission_raw.strip()
+    identifier = identifier.strip()
+    if not (target_type and permission_raw and identifier) or ":" in identifier:
+        # Irregular input (empty segments or extra colons): fall back to the
+        # tolerant split that ignores empty segments
+        parts = [part.strip() for part in entry.split(":") if part.strip()]
+        if len(parts) != 3:
+            raise ValueError(
+                "Share entries must follow 'target_type:permission:identifier' format"
+            )
+        target_type, permission_raw, identifier = parts
     target_type = target_type.lower()
-    if target_type not in {"user", "role"}:
+    if target_type not in _VALID_TARGET_TYPES:
         raise ValueError(f"Unsupported share target_type '{target_type}'")
     permission = Permission.from_value(permission_raw)
     if not identifier:
@@ -330,8 +579,19 @@ def parse_share_entry(entry: str) -> ShareEntry:
     return ShareEntry(target_type=target_type, permission=permission, identifier=identifier)
 
 
-def normalize_share_items(raw_share: Any) -> List[ShareEntry]:
-    """Normalize user-supplied share payload into ShareEntry objects."""
+def _dedupe_share_entries(entries: Iterable[ShareEntry]) -> List[ShareEntry]:
+    """Drop duplicate (target_type, permission, identifier) entries, keeping order."""
+
+    # ShareEntry is a frozen dataclass, so equal entries hash identically
+    return list(dict.fromkeys(entries))
+
+
+def normalize_share_items(raw_share: Any, dedupe: bool = True) -> List[ShareEntry]:
+    """Normalize user-supplied share payload into ShareEntry objects.
+
+    Pass ``dedupe=False`` when the caller merges several sources and performs a
+    single deduplication pass itself.
+    """
 
     if raw_share is None or raw_share == "":
         return []
@@ -349,10 +609,8 @@ def normalize_share_items(raw_share: Any) -> List[ShareEntry]:
         if not raw_str:
             return []
         try:
-            import json
-
-            parsed = json.loads(raw_str)
-        except (json.JSONDecodeError, TypeError):
+            parsed = orjson.loads(raw_str)
+        except (orjson.JSONDecodeError, TypeError):
             parsed = [item.strip() for item in raw_str.split(",") if item.strip()]
         raw_iterable = parsed if isinstance(parsed, list) else [parsed]
     else:
@@ -380,15 +638,7 @@ def normalize_share_items(raw_share: Any) -> List[ShareEntry]:
             entries.append(entry)
 
     # Deduplicate by (target_type, permission, identifier)
-    seen = set()
-    sanitized: List[ShareEntry] = []
-    for entry in entries:
-        key = (entry.target_type, entry.permission.value, entry.identifier)
-        if key not in seen:
-            seen.add(key)
-            sanitized.append(entry)
-
-    return sanitized
+    return _dedupe_share_entries(entries) if dedupe else entries
 
 
 def metadata_owner(metadata: Dict[str, Any]) -> Optional[str]:
@@ -413,7 +663,7 @@ def metadata_share_entries(metadata: Dict[str, Any]) -> List[ShareEntry]:
     for key in ("share_parsed", "share"):
         raw_value = metadata.get(key)
         if raw_value:
-            entries.extend(normalize_share_items(raw_value))
+            entries.extend(normalize_share_items(raw_value, dedupe=False))
 
     # Legacy access_control mapping
     access_control = metadata.get("access_control")
@@ -432,16 +682,14 @@ def metadata_share_entries(metadata: Dict[str, Any]) -> List[ShareEntry]:
                 ShareEntry(target_type="user", permission=Permission.EDIT, identifier=str(editor))
             )
 
-    # Deduplicate
-    deduped: List[ShareEntry] = []
-    seen = set()
-    for entry in entries:
-        key = (entry.target_type, entry.permission.value, entry.identifier)
-        if key not in seen:
-            seen.add(key)
-            deduped.append(entry)
+    # Single deduplication pass across all sources
+    return _dedupe_share_entries(entries)
+
+
+def metadata_share_index(metadata: Dict[str, Any]) -> ShareIndex:
+    """Build a ShareIndex from the metadata share entries (new + legacy formats)."""
 
-    return deduped
+    return ShareIndex.from_entries(metadata_share_entries(metadata))
 
 
 def metadata_matches_filters(metadata: Dict[str, Any], filters: AccessFilters) -> bool:
@@ -449,16 +697,13 @@ def metadata_matches_filters(metadata: Dict[str, Any], filters: AccessFilters) -
 
     if filters.project_id and metadata.get("project_id") != filters.project_id:
         return False
-    owner = metadata_owner(metadata)
-    if filters.owner and owner != filters.owner:
+    if filters.owner and metadata_owner(metadata) != filters.owner:
         return False
-    if filters.tags:
-        doc_tags = metadata_tags(metadata)
-        doc_lookup = {(tag["name"], tag["value"]) for tag in doc_tags}
-        for tag_filter in filters.tags:
-            expected = (tag_filter.get("name"), tag_filter.get("value", ""))
-            if expected not in doc_lookup:
-                return False
+    required_tags = filters.tag_keys
+    if required_tags:
+        doc_lookup = {(tag["name"], tag["value"]) for tag in metadata_tags(metadata)}
+        if not required_tags.issubset(doc_lookup):
+            return False
     # Note: filename filtering is handled separately in get_user_accessible_files
     # by checking the DocProcessingStatus.file_path field after metadata matching
     return True
@@ -468,6 +713,134 @@ def metadata_matches_filters(metadata: Dict[str, Any], filters: AccessFilters) -
 # Access evaluation helpers
 # ---------------------------------------------------------------------------
 
+def _filter_accessible_docs(
+    all_docs: dict[str, DocProcessingStatus],
+    user_snapshot: tuple[bool, Optional[str], frozenset[str]],
+    filters: AccessFilters,
+    include_shared: bool,
+    include_public: bool,
+    required_permission: Permission,
+    global_access: bool = False,
+) -> dict[str, DocProcessingStatus]:
+    """Synchronous access evaluation behind get_user_accessible_files.
+
+    Pure CPU work over already-fetched statuses, so it can run in a worker
+    thread. ``user_snapshot`` is ``(is_authenticated, user_id, roles)``.
+    ``global_access`` admits every document that passes the filters.
+    """
+
+    accessible_docs: dict[str, DocProcessingStatus] = {}
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    # Per-call invariants are bound to locals once instead of per document
+    is_authenticated, user_id, user_roles = user_snapshot
+    filters_active = not filters.is_empty
+    filename_filter = filters.filename
+    view_only = required_permission == Permission.VIEW
+    public_allowed = include_public and view_only
+
+    for doc_id, doc_status in all_docs.items():
+        metadata_source = getattr(doc_status, "metadata", None)
+        if metadata_source is None and isinstance(doc_status, dict):
+            metadata_source = doc_status.get("metadata")
+        # Metadata is only read below, so the stored mapping is used as-is
+        metadata = metadata_source or _EMPTY_METADATA
+
+        if filters_active and not metadata_matches_filters(metadata, filters):
+            if debug_enabled:
+                logger.debug(
+                    "get_user_accessible_files: Doc %s EXCLUDED by metadata filter "
+                    "(project_id=%r, owner=%r, tags=%s)",
+                    doc_id,
+                    metadata.get("project_id"),
+                    metadata_owner(metadata),
+                    metadata_tags(metadata),
+                )
+            continue
+
+        # Apply filename filter if provided (checks doc_status.file_path field)
+        if filename_filter:
+            file_path = doc_file_path(doc_status)
+            if not file_path or filename_filter not in file_path:
+                if debug_enabled:
+                    logger.debug(
+                        "get_user_accessible_files: Doc %s EXCLUDED by filename filter "
+                        "(expected %r in %r)",
+                        doc_id,
+                        filename_filter,
+                        file_path,
+                    )
+                continue
+
+        if global_access:
+            accessible_docs[doc_id] = doc_status
+            continue
+
+        # Check if document is public (no access control)
+        is_public = bool(metadata.get("is_public", False))
+
+        # Unauthenticated users can only see public documents
+        if not is_authenticated:
+            if is_public and include_public:
+                accessible_docs[doc_id] = doc_status
+            if debug_enabled:
+                logger.debug(
+                    "get_user_accessible_files: Doc %s %s (unauthenticated user, "
+                    "is_public=%s, include_public=%s)",
+                    doc_id,
+                    "ACCESSIBLE" if doc_id in accessible_docs else "NOT ACCESSIBLE",
+                    is_public,
+                    include_public,
+                )
+            continue
+
+        # Authenticated user access checks
+        # Ownership grants full access (check both owner and uploaded_by)
+        owner_id = metadata_owner(metadata)
+        is_owner = owner_id == user_id if owner_id and user_id else False
+        
+        # Also check if user uploaded the document
+        uploaded_by = metadata.get("uploaded_by")
+        is_uploader = uploaded_by == user_id if uploaded_by and user_id else False
+
+        # Check role-based access (legacy allowed_roles list)
+        allowed_roles = metadata.get("allowed_roles", []) or []
+        has_role_access = not user_roles.isdisjoint(allowed_roles)
+
+        # Determine if user has access (cheapest checks first, share entries last)
+        has_access = (
+            is_owner
+            or is_uploader
+            or (has_role_access and view_only)
+            or (is_public and public_allowed)
+        )
+
+        # Share entries are only parsed when no cheaper check granted access
+        share_count = 0
+        if not has_access and include_shared:
+            share_index = metadata_share_index(metadata)
+            share_count = len(share_index.entries)
+            has_access = share_index.grants(user_id, user_roles, required_permission)
+
+        if has_access:
+            accessible_docs[doc_id] = doc_status
+        if debug_enabled:
+            logger.debug(
+                "get_user_accessible_files: Doc %s %s (user %s, is_owner=%s, "
+                "is_uploader=%s, share_entries=%d, has_role_access=%s, is_public=%s)",
+                doc_id,
+                "ACCESSIBLE" if has_access else "NOT ACCESSIBLE",
+                user_id,
+                is_owner,
+                is_uploader,
+                share_count,
+                has_role_access,
+                is_public,
+            )
+
+    return accessible_docs
+
+
 async def get_user_accessible_files(
     doc_status_storage,
     current_user: CurrentUser,
@@ -486,6 +859,10 @@ async def get_user_accessible_files(
     - Role-based access (user has required role)
     - Public access (document is marked as public)
     - Project scoping (optional filter by project)
+
+    Results are cached per (user, filters) for ACCESSIBLE_FILES_CACHE_TTL_SECONDS,
+    and concurrent identical calls share a single scan; call
+    invalidate_accessible_files_cache() after writing document statuses.
     
     Args:
         doc_status_storage: Document status storage instance
@@ -510,118 +887,145 @@ async def get_user_accessible_files(
         # Returns: ["doc1.pdf", "doc2.pdf", "doc3.pdf"]
     """
     filters = filters or AccessFilters(project_id=project_id)
-    # Get all processed documents
-    all_docs = await doc_status_storage.get_docs_by_status(DocStatus.PROCESSED)
-    accessible_docs: dict[str, DocProcessingStatus] = {}
-    
-    # DEBUG: Log total documents found
-    from lightrag.utils import logger
-    logger.info(f"DEBUG get_user_accessible_files: Found {len(all_docs)} PROCESSED documents")
-    logger.info(
-        f"DEBUG get_user_accessible_files: Filters - project_id={repr(filters.project_id)}, "
-        f"owner={repr(filters.owner)}, tags={filters.tags}, "
-        f"current_user.is_authenticated={current_user.is_authenticated}"
+    cache_key = (
+        id(doc_status_storage),
+        _doc_status_version,
+        current_user.is_authenticated,
+        current_user.user_id,
+        current_user.role_set,
+        filters.project_id,
+        filters.owner,
+        filters.tag_keys,
+        filters.filename,
+        include_shared,
+        include_public,
+        required_permission,
     )
-
-    for doc_id, doc_status in all_docs.items():
-        metadata_source = getattr(doc_status, "metadata", None)
-        if metadata_source is None and isinstance(doc_status, dict):
-            metadata_source = doc_status.get("metadata")
-        metadata = (metadata_source or {}).copy()
-
-        # DEBUG: Log metadata check
-        matches_filters = metadata_matches_filters(metadata, filters)
-        if not matches_filters:
-            logger.info(
-                f"DEBUG get_user_accessible_files: Doc {doc_id} EXCLUDED by metadata filter. "
-                f"Doc has project_id={repr(metadata.get('project_id'))}, owner={repr(metadata_owner(metadata))}, "
-                f"tags={metadata_tags(metadata)}"
+    cached_docs = _accessible_files_cache.get(cache_key)
+    if cached_docs is None:
+        # Concurrent identical calls share one in-flight scan instead of each
+        # reading doc_status on a cold cache
+        pending = _accessible_files_inflight.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                _scan_accessible_files(
+                    doc_status_storage,
+                    current_user,
+                    filters,
+                    include_shared,
+                    include_public,
+                    required_permission,
+                    cache_key,
+                )
             )
-            continue
+            _accessible_files_inflight[cache_key] = pending
+            pending.add_done_callback(
+                lambda done: _accessible_files_inflight.pop(cache_key, None)
+                if _accessible_files_inflight.get(cache_key) is done
+                else None
+            )
+        # Shielded so a cancelled caller does not cancel a scan others await
+        cached_docs = await asyncio.shield(pending)
 
-        # Apply filename filter if provided (checks doc_status.file_path field)
-        if filters.filename:
-            file_path = doc_file_path(doc_status)
-            if not file_path or filters.filename not in file_path:
-                logger.info(
-                    f"DEBUG get_user_accessible_files: Doc {doc_id} EXCLUDED by filename filter. "
-                    f"Expected '{filters.filename}' in '{file_path}'"
-                )
-                continue
+    # Copy so callers may reshape their result without touching the cache
+    return dict(cached_docs)
 
-        # Check if document is public (no access control)
-        is_public = bool(metadata.get("is_public", False))
 
-        # Unauthenticated users can only see public documents
-        if not current_user.is_authenticated:
-            if is_public and include_public:
-                accessible_docs[doc_id] = doc_status
-                logger.info(f"DEBUG get_user_accessible_files: Doc {doc_id} ACCESSIBLE (public, unauthenticated user)")
-            else:
-                logger.info(
-                    f"DEBUG get_user_accessible_files: Doc {doc_id} NOT ACCESSIBLE "
-                    f"(unauthenticated user, is_public={is_public}, include_public={include_public})"
-                )
-            continue
+async def _scan_accessible_files(
+    doc_status_storage,
+    current_user: CurrentUser,
+    filters: AccessFilters,
+    include_shared: bool,
+    include_public: bool,
+    required_permission: Permission,
+    cache_key: Hashable,
+) -> dict[str, DocProcessingStatus]:
+    """Cache-miss path of get_user_accessible_files; stores its result under cache_key."""
+
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug(
+            "get_user_accessible_files: filters project_id=%r owner=%r tags=%s, "
+            "authenticated=%s",
+            filters.project_id,
+            filters.owner,
+            filters.as_dict()["tags"],
+            current_user.is_authenticated,
+        )
 
-        # Authenticated user access checks
-        user_id = current_user.user_id
-        user_roles = current_user.roles or []
+    # Snapshot the user so the worker thread never touches the shared object
+    user_snapshot = (
+        current_user.is_authenticated,
+        current_user.user_id,
+        current_user.role_set,
+    )
+    global_access = current_user.has_global_permission(required_permission)
+
+    async def evaluate(batch: dict[str, DocProcessingStatus]) -> None:
+        filter_args = (
+            batch,
+            user_snapshot,
+            filters,
+            include_shared,
+            include_public,
+            required_permission,
+            global_access,
+        )
+        # Full batches run off the event loop so they do not stall other requests
+        if len(batch) >= ACCESS_FILTER_THREAD_THRESHOLD:
+            accessible_docs.update(
+                await asyncio.to_thread(_filter_accessible_docs, *filter_args)
+            )
+        else:
+            accessible_docs.update(_filter_accessible_docs(*filter_args))
 
-        # Ownership grants full access (check both owner and uploaded_by)
-        owner_id = metadata_owner(metadata)
-        is_owner = owner_id == user_id if owner_id and user_id else False
-        
-        # Also check if user uploaded the document
-        uploaded_by = metadata.get("uploaded_by")
-        is_uploader = uploaded_by == user_id if uploaded_by and user_id else False
+    # Stream processed documents and evaluate them batch by batch, so only the
+    # current batch and the accessible subset are held in memory. project_id,
+    # owner and filename are pushed down to the storage query; the checks in
+    # the loop still apply because backends may return a superset.
+    accessible_docs: dict[str, DocProcessingStatus] = {}
+    batch: dict[str, DocProcessingStatus] = {}
+    total_docs = 0
+    async for doc_id, doc_status in doc_status_storage.get_docs_by_status_iter(
+        DocStatus.PROCESSED,
+        project_id=filters.project_id,
+        owner=filters.owner,
+        file_path_contains=filters.filename,
+    ):
+        batch[doc_id] = doc_status
+        if len(batch) >= ACCESS_FILTER_THREAD_THRESHOLD:
+            total_docs += len(batch)
+            await evaluate(batch)
+            batch = {}
+    if batch:
+        total_docs += len(batch)
+        await evaluate(batch)
+
+    if debug_enabled:
+        logger.debug(
+            "get_user_accessible_files: Returning %d of %d PROCESSED documents",
+            len(accessible_docs),
+            total_docs,
+        )
+    _accessible_files_cache.set(cache_key, accessible_docs)
+    return accessible_docs
 
-        # Share entries
-        share_entries = metadata_share_entries(metadata)
 
-        # Check role-based access (legacy allowed_roles list)
-        allowed_roles = metadata.get("allowed_roles", []) or []
-        has_role_access = any(role in user_roles for role in allowed_roles)
+def accessible_path_set(accessible_files: dict[str, DocProcessingStatus]) -> frozenset[str]:
+    """Collect the non-empty file paths of accessible documents once per call."""
 
-        # Determine if user has access (use OR logic, not elif chain)
-        has_access = False
+    return frozenset(filter(None, map(doc_file_path, accessible_files.values())))
 
-        # Check 1: User is the owner or uploader
-        if is_owner or is_uploader:
-            has_access = True
-        
-        # Check 2: Document is shared with user (if not already granted access)
-        if not has_access and include_shared and share_entries:
-            for entry in share_entries:
-                if entry.matches_user(user_id, user_roles) and entry.allows(required_permission):
-                    has_access = True
-                    break
-        
-        # Check 3: User has role-based access (if not already granted access)
-        if not has_access and has_role_access and required_permission == Permission.VIEW:
-            has_access = True
-        
-        # Check 4: Document is public (if not already granted access)
-        if not has_access and is_public and include_public and required_permission == Permission.VIEW:
-            has_access = True
 
-        if has_access:
-            accessible_docs[doc_id] = doc_status
-            logger.info(
-                f"DEBUG get_user_accessible_files: Doc {doc_id} ACCESSIBLE "
-                f"(authenticated user, is_owner={is_owner}, is_uploader={is_uploader}, "
-                f"has_share_access={include_shared and share_entries}, "
-                f"has_role_access={has_role_access}, is_public={is_public})"
-            )
-        else:
-            logger.info(
-                f"DEBUG get_user_accessible_files: Doc {doc_id} NOT ACCESSIBLE "
-                f"(authenticated user {user_id}, is_owner={is_owner}, is_uploader={is_uploader}, "
-                f"share_entries={len(share_entries)}, has_role_access={has_role_access}, is_public={is_public})"
-            )
+def path_is_accessible(file_path: str, accessible_paths: frozenset[str]) -> bool:
+    """Exact membership first; substring scan keeps partial-path matching semantics."""
 
-    logger.info(f"DEBUG get_user_accessible_files: Returning {len(accessible_docs)} accessible documents")
-    return accessible_docs
+    if file_path in accessible_paths:
+        return True
+    if not accessible_paths:
+        # An empty alternation would match every string
+        return False
+    return substring_alternation(accessible_paths).search(file_path) is not None
 
 
 async def filter_chunks_by_access(
@@ -638,15 +1042,25 @@ async def filter_chunks_by_access(
     Returns:
         Filtered list of chunks
     """
-    accessible_paths = {
-        path for path in (doc_file_path(status) for status in accessible_files.values()) if path
-    }
+    accessible_paths = accessible_path_set(accessible_files)
+    if not accessible_paths:
+        return []
 
-    return [
-        chunk
-        for chunk in chunks
-        if any(access_path in (chunk.get("file_path") or "") for access_path in accessible_paths)
-    ]
+    # Chunks of one document share a file_path, so each distinct path is
+    # resolved once; the substring fallback only runs for non-exact misses
+    decisions: dict[str, bool] = {}
+    filtered = []
+    for chunk in chunks:
+        file_path = chunk.get("file_path") or ""
+        allowed = decisions.get(file_path)
+        if allowed is None:
+            allowed = decisions[file_path] = path_is_accessible(
+                file_path, accessible_paths
+            )
+        if allowed:
+            filtered.append(chunk)
+
+    return filtered
 
 
 async def filter_entities_by_access(
@@ -662,24 +1076,27 @@ async def filter_entities_by_access(
     
     Args:
         entities: List of entity dictionaries with file_path field
-        accessible_files: List of file_path strings user can access
+        accessible_files: Mapping of accessible doc IDs to status objects
         
     Returns:
         Filtered list of entities
     """
+    accessible_paths = accessible_path_set(accessible_files)
+    if not accessible_paths:
+        return []
+
+    pattern = substring_alternation(accessible_paths)
     filtered = []
     for entity in entities:
         # Entities can have multiple file_paths separated by <SEP>
-        entity_file_paths = entity.get("file_path", "").split(GRAPH_FIELD_SEP)
-        
-        # Check if ANY of the entity's file_paths are accessible
-        for accessible_status in accessible_files.values():
-            file_path = doc_file_path(accessible_status)
-            if not file_path:
-                continue
-            if any(file_path in fp for fp in entity_file_paths):
-                filtered.append(entity)
-                break
+        entity_file_paths = (entity.get("file_path") or "").split(GRAPH_FIELD_SEP)
+
+        # Check if ANY of the entity's file_paths are accessible. Paths are
+        # searched one by one so a match can never straddle a separator.
+        if not accessible_paths.isdisjoint(entity_file_paths) or any(
+            pattern.search(fp) is not None for fp in entity_file_paths
+        ):
+            filtered.append(entity)
 
     return filtered
 
@@ -687,8 +1104,7 @@ async def filter_entities_by_access(
 def doc_file_path(doc_status: Any) -> Optional[str]:
     """Extract file_path from DocProcessingStatus or dict."""
 
-    value = getattr(doc_status, "file_path", None)
-    if value is None and isinstance(doc_status, dict):
-        value = doc_status.get("file_path")
-    return value
+    if isinstance(doc_status, dict):
+        return doc_status.get("file_path")
+    return getattr(doc_status, "file_path", None)
 
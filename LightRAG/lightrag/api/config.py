@@ -361,6 +361,8 @@ def parse_args() -> argparse.Namespace:
     args.token_expire_hours = get_env_value("TOKEN_EXPIRE_HOURS", 48, int)
     args.guest_token_expire_hours = get_env_value("GUEST_TOKEN_EXPIRE_HOURS", 24, int)
     args.jwt_algorithm = get_env_value("JWT_ALGORITHM", "HS256")
+    # Comma separated roles that may view every document (empty disables)
+    args.global_view_roles = get_env_value("GLOBAL_VIEW_ROLES", "")
 
     # Rerank model configuration
     args.rerank_model = get_env_value("RERANK_MODEL", None)
@@ -40,6 +40,7 @@ from ..access_control import (
     get_current_user_optional,
     get_current_user_required,
     get_user_accessible_files,
+    invalidate_accessible_files_cache,
     normalize_share_items,
     normalize_tag_items,
 )
@@ -1542,6 +1543,7 @@ async def pipeline_index_file(
         )
         if success:
             await rag.apipeline_process_enqueue_documents()
+            invalidate_accessible_files_cache()
 
     except Exception as e:
         logger.error(f"Error indexing file {file_path.name}: {str(e)}")
@@ -1581,11 +1583,40 @@ async def pipeline_index_files(
         # Process the queue only if at least one file was successfully enqueued
         if enqueued:
             await rag.apipeline_process_enqueue_documents()
+            invalidate_accessible_files_cache()
     except Exception as e:
         logger.error(f"Error indexing files: {str(e)}")
         logger.error(traceback.format_exc())
 
 
+async def process_document_raganything(
+    rag_anything: RAGAnything,
+    file_path: Path,
+    scheme_name: str = None,
+    parser: str = None,
+    source: str = None,
+    metadata: dict[str, Any] | None = None,
+):
+    """Process a single file with RAGAnything and refresh accessible-file caches.
+
+    Exceptions from RAGAnything propagate to the caller unchanged; the
+    accessible-files cache is invalidated either way so documents whose status
+    changed become visible without waiting for the cache TTL.
+    """
+    try:
+        return await rag_anything.process_document_complete_lightrag_api(
+            file_path=str(file_path),
+            output_dir="./output",
+            parse_method="auto",
+            scheme_name=scheme_name,
+            parser=parser,
+            source=source,
+            metadata=metadata,
+        )
+    finally:
+        invalidate_accessible_files_cache()
+
+
 async def pipeline_index_files_raganything(
     rag_anything: RAGAnything,
     file_paths: List[Path],
@@ -1599,7 +1630,6 @@ async def pipeline_index_files_raganything(
     Args:
         rag_anything (RAGAnything): RAGAnything instance for multimodal document processing
         file_paths (List[Path]): List of file paths to be processed
-        track_id (str, optional): Tracking ID for batch monitoring. Defaults to None.
         scheme_name (str, optional): Processing scheme name for categorization.
             Defaults to None.
         parser (str, optional): Document extraction tool to use.
@@ -1610,39 +1640,32 @@ async def pipeline_index_files_raganything(
             Defaults to None.
 
     Note:
-        - Uses RAGAnything's process_document_complete_lightrag_api method for each file
+        - Uses process_document_raganything for each file, so the accessible-files
+          cache is invalidated after every document
         - Supports multimodal content processing (images, tables, equations)
-        - Files are processed with "auto" parse method and "modelscope" source
+        - Files are processed with "auto" parse method
         - Output is saved to "./output" directory
         - Errors are logged but don't stop processing of remaining files
     """
     if not file_paths:
         return
 
-    try:
-        # Use get_pinyin_sort_key for Chinese pinyin sorting
-        sorted_file_paths = sorted(
-            file_paths, key=lambda p: get_pinyin_sort_key(str(p))
-        )
+    # Use get_pinyin_sort_key for Chinese pinyin sorting
+    sorted_file_paths = sorted(file_paths, key=lambda p: get_pinyin_sort_key(str(p)))
 
-        # Process files sequentially with track_id
-        for file_path in sorted_file_paths:
-            success = await rag_anything.process_document_complete_lightrag_api(
-                file_path=str(file_path),
-                output_dir="./output",
-                parse_method="auto",
+    for file_path in sorted_file_paths:
+        try:
+            await process_document_raganything(
+                rag_anything,
+                file_path,
                 scheme_name=scheme_name,
                 parser=parser,
                 source=source,
                 metadata=metadata,
             )
-            if success:
-                pass
-
-    except Exception as e:
-        error_msg = f"Error indexing files: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
+        except Exception as e:
+            logger.error(f"Error indexing file {Path(file_path).name}: {str(e)}")
+            logger.error(traceback.format_exc())
 
 
 async def pipeline_index_texts(
@@ -1704,6 +1727,7 @@ async def pipeline_index_texts(
                 logger.debug(f"Updated doc_status with metadata for {doc_id}")
     
     await rag.apipeline_process_enqueue_documents()
+    invalidate_accessible_files_cache()
 
 
 async def run_scanning_process(
@@ -1801,6 +1825,7 @@ async def run_scanning_process(
                 "No upload file found, check if there are any documents in the queue..."
             )
             await rag.apipeline_process_enqueue_documents()
+            invalidate_accessible_files_cache()
 
     except Exception as e:
         logger.error(f"Error during scanning process: {str(e)}")
@@ -1983,6 +2008,9 @@ async def background_delete_documents(
         async with pipeline_status_lock:
             pipeline_status["history_messages"].append(error_msg)
     finally:
+        if successful_deletions:
+            invalidate_accessible_files_cache()
+
         # Final summary and check for pending requests
         async with pipeline_status_lock:
             pipeline_status["busy"] = False
@@ -2000,6 +2028,7 @@ async def background_delete_documents(
                     "Processing pending document indexing requests after deletion"
                 )
                 await rag.apipeline_process_enqueue_documents()
+                invalidate_accessible_files_cache()
             except Exception as e:
                 logger.error(f"Error processing pending documents after deletion: {e}")
 
@@ -2453,10 +2482,9 @@ def create_document_routes(
             else:
                 logger.info("AZ>> adding background task for raganything processing")
                 background_tasks.add_task(
-                    rag_anything.process_document_complete_lightrag_api,
-                    file_path=str(file_path),
-                    output_dir="./output",
-                    parse_method="auto",
+                    process_document_raganything,
+                    rag_anything,
+                    file_path,
                     scheme_name=current_framework,
                     parser=current_extractor,
                     source=current_modelSource,
@@ -2711,6 +2739,7 @@ def create_document_routes(
 
             # Wait for all drop tasks to complete
             drop_results = await asyncio.gather(*drop_tasks, return_exceptions=True)
+            invalidate_accessible_files_cache()
 
             # Check for errors and log results
             errors = []
@@ -2,7 +2,8 @@
 This module contains all graph-related routes for the LightRAG API.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import logging
 import traceback
 from fastapi import APIRouter, Depends, Query, HTTPException
 from pydantic import BaseModel
@@ -13,10 +14,11 @@ from ..access_control import (
     AccessFilters,
     CurrentUser,
     Permission,
-    doc_file_path,
+    accessible_path_set,
     get_current_user_optional,
     get_user_accessible_files,
     normalize_tag_items,
+    path_is_accessible,
 )
 
 router = APIRouter(tags=["graph"])
@@ -28,6 +30,10 @@ class EntityUpdateRequest(BaseModel):
     allow_rename: bool = False
 
 
+class EntityExistsBatchRequest(BaseModel):
+    names: List[str]
+
+
 class RelationUpdateRequest(BaseModel):
     source_id: str
     target_id: str
@@ -91,31 +97,60 @@ def create_graph_routes(rag, api_key: Optional[str] = None):
         Returns:
             Dict[str, List[str]]: Knowledge graph for label
         """
-        try:
+
+        def graph_error(e: Exception) -> HTTPException:
+            # Called from except blocks; logger.exception attaches the traceback
+            logger.exception(f"Error getting knowledge graph for label '{label}': {str(e)}")
+            return HTTPException(
+                status_code=500, detail=f"Error getting knowledge graph: {str(e)}"
+            )
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
             # Log the label parameter to check for leading spaces
             logger.debug(
-                f"get_knowledge_graph called with label: '{label}' (length: {len(label)}, repr: {repr(label)})"
+                "get_knowledge_graph called with label: %r (length: %d)",
+                label,
+                len(label),
             )
-
-            # DEBUG: Log received filter parameters
-            logger.info(
-                f"DEBUG get_knowledge_graph: Received filters - "
-                f"project_id={repr(project_id)}, owner={repr(owner)}, tags={repr(tags)}, "
-                f"current_user.is_authenticated={current_user.is_authenticated}"
+            logger.debug(
+                "get_knowledge_graph: Received filters - project_id=%r, owner=%r, "
+                "tags=%r, current_user.is_authenticated=%s",
+                project_id,
+                owner,
+                tags,
+                current_user.is_authenticated,
             )
 
-            filters = AccessFilters(
-                project_id=project_id,
-                owner=owner,
-                tags=normalize_tag_items(tags),
-            )
+        filters = AccessFilters(
+            project_id=project_id,
+            owner=owner,
+            tags=normalize_tag_items(tags),
+        )
 
-            # DEBUG: Log normalized filters
-            logger.info(
-                f"DEBUG get_knowledge_graph: Normalized filters - "
-                f"project_id={repr(filters.project_id)}, owner={repr(filters.owner)}, tags={filters.tags}"
+        if debug_enabled:
+            logger.debug(
+                "get_knowledge_graph: Normalized filters - project_id=%r, owner=%r, "
+                "tags=%s",
+                filters.project_id,
+                filters.owner,
+                filters.as_dict()["tags"],
             )
 
+        # Global viewers without narrowing filters would admit every node,
+        # so the access scan and post-filter are skipped entirely
+        if filters.is_empty and current_user.has_global_permission(Permission.VIEW):
+            try:
+                return await rag.get_knowledge_graph(
+                    node_label=label,
+                    max_depth=max_depth,
+                    max_nodes=max_nodes,
+                    file_path=file_path,
+                )
+            except Exception as e:
+                raise graph_error(e)
+
+        try:
             accessible_docs = await get_user_accessible_files(
                 rag.doc_status,
                 current_user,
@@ -125,88 +160,107 @@ def create_graph_routes(rag, api_key: Optional[str] = None):
                 filters=filters,
                 required_permission=Permission.VIEW,
             )
+        except Exception as e:
+            raise graph_error(e)
 
-            # DEBUG: Log accessible documents count
-            logger.info(f"DEBUG get_knowledge_graph: Found {len(accessible_docs)} accessible documents")
+        if debug_enabled:
+            logger.debug(
+                "get_knowledge_graph: Found %d accessible documents",
+                len(accessible_docs),
+            )
 
-            if not accessible_docs:
-                raise HTTPException(
-                    status_code=403,
-                    detail="No accessible documents found for the provided metadata filters.",
-                )
+        if not accessible_docs:
+            raise HTTPException(
+                status_code=403,
+                detail="No accessible documents found for the provided metadata filters.",
+            )
+
+        accessible_paths = accessible_path_set(accessible_docs)
 
+        # Storages that support it prune inaccessible nodes during traversal;
+        # the filter below still applies to every backend
+        try:
             graph = await rag.get_knowledge_graph(
                 node_label=label,
                 max_depth=max_depth,
                 max_nodes=max_nodes,
                 file_path=file_path,
+                accessible_file_paths=accessible_paths,
             )
+        except Exception as e:
+            raise graph_error(e)
 
-            accessible_paths = [
-                path for path in (doc_file_path(status) for status in accessible_docs.values()) if path
-            ]
-
-            def node_accessible(node: Any) -> bool:
-                props = getattr(node, "properties", None)
-                if props is None and isinstance(node, dict):
-                    props = node.get("properties")
-                if not isinstance(props, dict):
-                    return True
-
-                file_values: list[str] = []
-                for key in ("file_path", "file_paths", "sources", "documents"):
-                    value = props.get(key)
-                    if isinstance(value, str):
-                        file_values.append(value)
-                    elif isinstance(value, list):
-                        file_values.extend([str(v) for v in value if isinstance(v, str)])
-
-                if not file_values:
-                    return True
+        # Nodes sharing a source file resolve it once per request
+        path_decisions: Dict[str, bool] = {}
 
-                return any(
-                    any(access_path in candidate for access_path in accessible_paths)
-                    for candidate in file_values
+        def candidate_accessible(candidate: str) -> bool:
+            allowed = path_decisions.get(candidate)
+            if allowed is None:
+                allowed = path_decisions[candidate] = path_is_accessible(
+                    candidate, accessible_paths
                 )
-
-            def to_dict(item: Any) -> Dict[str, Any]:
-                if hasattr(item, "model_dump"):
-                    return item.model_dump()
-                if hasattr(item, "dict"):
-                    return item.dict()
-                return item
-
-            graph_dict = to_dict(graph)
-            nodes = graph_dict.get("nodes", [])
-            filtered_nodes = [node for node in nodes if node_accessible(node)]
-            allowed_ids = {
-                (node.get("id") if isinstance(node, dict) else getattr(node, "id", None))
-                for node in filtered_nodes
-            }
-
-            edges = graph_dict.get("edges", [])
-            filtered_edges = []
-            for edge in edges:
-                edge_dict = to_dict(edge)
-                if (
-                    edge_dict.get("source") in allowed_ids
-                    and edge_dict.get("target") in allowed_ids
-                ):
-                    filtered_edges.append(edge)
-
-            graph_dict["nodes"] = filtered_nodes
-            graph_dict["edges"] = filtered_edges
-
-            if hasattr(graph.__class__, "model_validate"):
-                return graph.__class__.model_validate(graph_dict)
-
-            return graph_dict
-        except Exception as e:
-            logger.error(f"Error getting knowledge graph for label '{label}': {str(e)}")
-            logger.error(traceback.format_exc())
-            raise HTTPException(
-                status_code=500, detail=f"Error getting knowledge graph: {str(e)}"
-            )
+            return allowed
+
+        def file_candidates(props: Dict[str, Any]):
+            for key in ("file_path", "file_paths", "sources", "documents"):
+                value = props.get(key)
+                if isinstance(value, str):
+                    yield value
+                elif isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, str):
+                            yield item
+
+        def node_accessible(node: Any) -> bool:
+            props = getattr(node, "properties", None)
+            if props is None and isinstance(node, dict):
+                props = node.get("properties")
+            if not isinstance(props, dict):
+                return True
+
+            # Candidates are produced lazily so the first accessible one
+            # ends the check; nodes without any source stay visible
+            has_candidates = False
+            for candidate in file_candidates(props):
+                if candidate_accessible(candidate):
+                    return True
+                has_candidates = True
+            return not has_candidates
+
+        def field_of(item: Any, key: str) -> Any:
+            # Read dict keys or model attributes without dumping the item
+            if isinstance(item, dict):
+                return item.get(key)
+            return getattr(item, key, None)
+
+        # Nodes and edges are read in place; the graph is never dumped
+        nodes = field_of(graph, "nodes") or []
+        # One pass over the nodes collects both the kept nodes and their ids
+        filtered_nodes = []
+        allowed_ids = set()
+        for node in nodes:
+            if node_accessible(node):
+                filtered_nodes.append(node)
+                allowed_ids.add(field_of(node, "id"))
+
+        edges = field_of(graph, "edges") or []
+        # Storage subgraphs may carry edges to nodes they did not return
+        # (e.g. file_path filtering), so edges are always checked
+        filtered_edges = [
+            edge
+            for edge in edges
+            if field_of(edge, "source") in allowed_ids
+            and field_of(edge, "target") in allowed_ids
+        ]
+
+        if isinstance(graph, dict):
+            return {**graph, "nodes": filtered_nodes, "edges": filtered_edges}
+
+        # The filtered lists hold already-validated models, so a shallow copy
+        # replaces them without another validation pass
+        return graph.model_copy(
+            update={"nodes": filtered_nodes, "edges": filtered_edges}
+        )
 
     @router.get("/graph/entity/exists", dependencies=[Depends(combined_auth)])
     async def check_entity_exists(
@@ -231,6 +285,31 @@ def create_graph_routes(rag, api_key: Optional[str] = None):
                 status_code=500, detail=f"Error checking entity existence: {str(e)}"
             )
 
+    @router.post("/graph/entity/exists_batch", dependencies=[Depends(combined_auth)])
+    async def check_entities_exist(request: EntityExistsBatchRequest):
+        """
+        Check which of the given entity names exist in the knowledge graph
+
+        Uses the storage batch lookup, so many names cost one round trip on
+        backends that support it.
+
+        Args:
+            request (EntityExistsBatchRequest): Request containing the entity names
+
+        Returns:
+            Dict[str, Dict[str, bool]]: 'exists' maps each name to whether it exists
+        """
+        try:
+            names = list(dict.fromkeys(request.names))
+            found = await rag.chunk_entity_relation_graph.get_nodes_batch(names)
+            return {"exists": {name: name in found for name in names}}
+        except Exception as e:
+            logger.error(f"Error checking entity existence in batch: {str(e)}")
+            logger.error(traceback.format_exc())
+            raise HTTPException(
+                status_code=500, detail=f"Error checking entity existence: {str(e)}"
+            )
+
     @router.post("/graph/entity/edit", dependencies=[Depends(combined_auth)])
     async def update_entity(request: EntityUpdateRequest):
         """
@@ -2,12 +2,19 @@
 This module contains all query-related routes for the LightRAG API.
 """
 
-import json
+import asyncio
 import logging
-from typing import Any, Dict, List, Literal, Optional
-
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Literal, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from lightrag.base import QueryParam
 from lightrag.utils import logger
 from ..utils_api import get_combined_auth_dependency
@@ -22,9 +29,73 @@ from ..access_control import (
 )
 from pydantic import BaseModel, Field, field_validator
 
-from ascii_colors import trace_exception
 
-router = APIRouter(tags=["query"])
+# orjson options shared by every JSON body and stream line this router emits
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def json_bytes(content: Any, option: int = 0) -> bytes:
+    """Encode content with orjson, falling back to jsonable_encoder.
+
+    Types orjson cannot encode natively (sets, Pydantic models, arbitrary
+    objects) go through FastAPI's jsonable_encoder, as they did before the
+    router switched to orjson.
+    """
+    return orjson.dumps(content, default=jsonable_encoder, option=JSON_OPTIONS | option)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return json_bytes(content)
+
+
+class QueryRoute(APIRoute):
+    """APIRoute that turns unexpected handler errors into logged 500 responses.
+
+    HTTP and validation errors keep their own status codes; anything else is
+    logged once here instead of in a try/except in every endpoint.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request):
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                logger.exception("Unhandled error in %s", request.url.path)
+                return ORJSONResponse({"detail": str(e)}, status_code=500)
+
+        return route_handler
+
+
+router = APIRouter(
+    tags=["query"], default_response_class=ORJSONResponse, route_class=QueryRoute
+)
+
+# Streamed tokens are coalesced into one NDJSON line until this many characters
+# are buffered or this much time has passed since the previous line
+STREAM_FLUSH_CHARS = 4096
+STREAM_FLUSH_SECONDS = 0.04
+
+# Idle Server-Sent Event streams get a comment line this often, so reverse
+# proxies do not time out while the LLM is still generating
+SSE_PING_SECONDS = 15.0
+_IDLE = object()
+
+# Constant /query bodies for callers without any accessible document
+_NO_DOCS_FILTER_BODY = orjson.dumps(
+    {"response": "No accessible documents found for the provided metadata filters."}
+)
+_NO_DOCS_AUTH_BODY = orjson.dumps(
+    {
+        "response": "Please authenticate or provide appropriate metadata to access documents."
+    }
+)
 
 
 class TagFilter(BaseModel):
@@ -51,16 +122,19 @@ class AccessFilterPayload(BaseModel):
     """Metadata filters provided by the client to scope query results."""
 
     project_id: Optional[str] = Field(
-        default=None, description="Project identifier used to scope accessible documents"
+        default=None,
+        description="Project identifier used to scope accessible documents",
     )
     owner: Optional[str] = Field(
         default=None, description="Owner user id used to scope accessible documents"
     )
     tags: Optional[List[TagFilter]] = Field(
-        default=None, description="List of tags (name/value pairs) that documents must contain"
+        default=None,
+        description="List of tags (name/value pairs) that documents must contain",
     )
     filename: Optional[str] = Field(
-        default=None, description="Filter by document filename (supports partial matching)"
+        default=None,
+        description="Filter by document filename (supports partial matching)",
     )
 
     @field_validator("project_id", "owner", "filename", mode="after")
@@ -69,6 +143,12 @@ class AccessFilterPayload(BaseModel):
         return value.strip() if isinstance(value, str) else value
 
 
+# QueryRequest fields that steer the API layer and are not QueryParam arguments
+_REQUEST_ONLY_FIELDS = frozenset(
+    {"query", "access_filters", "include_accessible_files"}
+)
+
+
 class QueryRequest(BaseModel):
     query: str = Field(
         min_length=1,
@@ -156,6 +236,11 @@ class QueryRequest(BaseModel):
         description="Metadata filters (project/owner/tags) applied before executing the query",
     )
 
+    include_accessible_files: bool = Field(
+        default=False,
+        description="If True, /query/data lists the caller's accessible file paths in metadata.accessible_files.",
+    )
+
     @field_validator("query", mode="after")
     @classmethod
     def query_strip_after(cls, query: str) -> str:
@@ -177,11 +262,13 @@ class QueryRequest(BaseModel):
 
     def to_query_params(self, is_stream: bool) -> "QueryParam":
         """Converts a QueryRequest instance into a QueryParam instance."""
-        # Use Pydantic's `.model_dump(exclude_none=True)` to remove None values automatically
-        request_data = self.model_dump(
-            exclude_none=True,
-            exclude={"query", "access_filters"},
-        )
+        # Fields are already validated, so they are read straight from the model
+        # instead of through model_dump(); None values are skipped as before
+        request_data = {
+            name: value
+            for name, value in self.__dict__.items()
+            if value is not None and name not in _REQUEST_ONLY_FIELDS
+        }
 
         # Ensure `mode` and `stream` are set explicitly
         param = QueryParam(**request_data)
@@ -189,26 +276,80 @@ class QueryRequest(BaseModel):
         return param
 
 
-def build_access_filters(payload: AccessFilterPayload | None) -> AccessFilters:
-    """Convert request payload into AccessFilters used by access control layer."""
-
-    if payload is None:
-        return AccessFilters()
+@lru_cache(maxsize=1024)
+def _cached_access_filters(
+    project_id: Optional[str],
+    owner: Optional[str],
+    tag_pairs: Optional[tuple[tuple[str, Optional[str]], ...]],
+    filename: Optional[str],
+) -> AccessFilters:
+    """Build AccessFilters once per distinct payload; results are shared read-only."""
 
     tags_payload = (
-        [tag.model_dump() for tag in payload.tags]
-        if payload.tags
+        [{"name": name, "value": value} for name, value in tag_pairs]
+        if tag_pairs
         else None
     )
     tags = normalize_tag_items(tags_payload)
     return AccessFilters(
-        project_id=payload.project_id,
-        owner=payload.owner,
+        project_id=project_id,
+        owner=owner,
         tags=tags,
-        filename=payload.filename,
+        filename=filename,
     )
 
 
+def build_access_filters(payload: AccessFilterPayload | None) -> AccessFilters:
+    """Convert request payload into AccessFilters used by access control layer."""
+
+    if payload is None:
+        return AccessFilters()
+
+    tag_pairs = (
+        tuple((tag.name, tag.value) for tag in payload.tags) if payload.tags else None
+    )
+    return _cached_access_filters(
+        payload.project_id, payload.owner, tag_pairs, payload.filename
+    )
+
+
+def ndjson_line(payload: Dict[str, Any]) -> bytes:
+    return json_bytes(payload) + b"\n"
+
+
+def sse_event(payload: Dict[str, Any]) -> bytes:
+    # orjson escapes newlines, so the payload always fits one data: line
+    return b"data: " + json_bytes(payload) + b"\n\n"
+
+
+async def with_idle_ticks(source, timeout: Callable[[], Optional[float]]):
+    """Re-yield items from an async iterator, yielding _IDLE when it stalls.
+
+    ``timeout()`` is re-read before every wait, so the caller can shorten it
+    (e.g. to the rest of a flush window) or return None to wait indefinitely.
+    """
+
+    iterator = source.__aiter__()
+    pending = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            done, _ = await asyncio.wait((pending,), timeout=timeout())
+            if not done:
+                yield _IDLE
+                continue
+            finished, pending = pending, None
+            try:
+                item = finished.result()
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
 class QueryResponse(BaseModel):
     response: str = Field(
         description="The generated response",
@@ -233,16 +374,48 @@ class QueryDataResponse(BaseModel):
 def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
     combined_auth = get_combined_auth_dependency(api_key)
 
-    def apply_doc_id_filter(param: QueryParam, accessible_docs: dict[str, Any]) -> None:
+    def apply_doc_id_filter(
+        param: QueryParam, accessible_docs: dict[str, Any], full_corpus: bool = False
+    ) -> None:
         """Set QueryParam.ids based on accessible documents and client request."""
-        accessible_ids = list(accessible_docs.keys())
 
         if param.ids:
-            # Client provided specific IDs - intersect with accessible docs
-            param.ids = [doc_id for doc_id in param.ids if doc_id in accessible_docs]
+            # Client provided specific IDs - intersect with accessible docs,
+            # probing the dict from C while keeping the client's order
+            param.ids = list(filter(accessible_docs.__contains__, param.ids))
+        elif full_corpus:
+            # Every document is accessible - leave retrieval unfiltered rather
+            # than pass the whole corpus as an explicit id list
+            param.ids = None
         else:
             # No client filter - use all accessible docs
-            param.ids = accessible_ids
+            param.ids = list(accessible_docs)
+
+    async def scope_query_to_user(
+        request: QueryRequest, current_user: CurrentUser, is_stream: bool
+    ) -> tuple[QueryParam, dict[str, Any], AccessFilters]:
+        """Build the QueryParam for a request and restrict it to the caller's documents.
+
+        accessible_docs is empty when the caller can see nothing; param.ids is
+        only narrowed otherwise, and each route reports the empty case itself.
+        """
+        param = request.to_query_params(is_stream)
+        filters = build_access_filters(request.access_filters)
+        accessible_docs = await get_user_accessible_files(
+            rag.doc_status,
+            current_user,
+            project_id=filters.project_id,
+            include_shared=True,
+            include_public=True,
+            filters=filters,
+            required_permission=Permission.VIEW,
+        )
+        if accessible_docs:
+            full_corpus = filters.is_empty and current_user.has_global_permission(
+                Permission.VIEW
+            )
+            apply_doc_id_filter(param, accessible_docs, full_corpus)
+        return param, accessible_docs, filters
 
     @router.post(
         "/query", response_model=QueryResponse, dependencies=[Depends(combined_auth)]
@@ -253,10 +426,10 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
     ):
         """
         Handle a POST request at the /query endpoint to process user queries using RAG capabilities.
-        
+
         Document ID filtering: The system now filters results by document IDs during retrieval.
         - Vector databases filter chunks by full_doc_id field (supported in Milvus, MongoDB, PostgreSQL, Qdrant, Faiss, NanoVectorDB)
-        - Graph databases filter entities/relationships by their source_id (chunk IDs) 
+        - Graph databases filter entities/relationships by their source_id (chunk IDs)
         - See _get_chunk_ids_for_doc_ids() in operate.py for the doc_id → chunk_id mapping logic
 
         Parameters:
@@ -270,52 +443,48 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
             HTTPException: Raised when an error occurs during the request handling process,
                        with status code 500 and detail containing the exception message.
         """
-        try:
-            param = request.to_query_params(False)
-            filters = build_access_filters(request.access_filters)
-
-            accessible_docs = await get_user_accessible_files(
-                rag.doc_status,
-                current_user,
-                project_id=filters.project_id,
-                include_shared=True,
-                include_public=True,
-                filters=filters,
-                required_permission=Permission.VIEW,
-            )
-            
-            if not accessible_docs:
-                detail = (
-                    "No accessible documents found for the provided metadata filters."
-                    if current_user.is_authenticated
-                    else "Please authenticate or provide appropriate metadata to access documents."
-                )
-                return QueryResponse(response=detail)
+        param, accessible_docs, _ = await scope_query_to_user(
+            request, current_user, is_stream=False
+        )
 
-            apply_doc_id_filter(param, accessible_docs)
+        if not accessible_docs:
+            body = (
+                _NO_DOCS_FILTER_BODY
+                if current_user.is_authenticated
+                else _NO_DOCS_AUTH_BODY
+            )
+            return Response(content=body, media_type="application/json")
 
-            logger.info(f"[query_text] Invoking rag.aquery() with param.ids={param.ids}")
-            response = await rag.aquery(request.query, param=param)
+        logger.info(
+            "[query_text] Invoking rag.aquery() with %s document ids",
+            "all" if param.ids is None else len(param.ids),
+        )
+        response = await rag.aquery(request.query, param=param)
 
-            if isinstance(response, str):
-                return QueryResponse(response=response)
+        if isinstance(response, str):
+            return QueryResponse(response=response)
 
-            if isinstance(response, dict):
-                return QueryResponse(response=json.dumps(response, indent=2))
+        if isinstance(response, dict):
+            # Indented for readability, as the text is shown to users as-is
+            return QueryResponse(
+                response=json_bytes(response, orjson.OPT_INDENT_2).decode()
+            )
 
-            return QueryResponse(response=str(response))
-        except Exception as e:
-            trace_exception(e)
-            raise HTTPException(status_code=500, detail=str(e))
+        return QueryResponse(response=str(response))
 
     @router.post("/query/stream", dependencies=[Depends(combined_auth)])
     async def query_text_stream(
         request: QueryRequest,
+        accept: Optional[str] = Header(default=None),
         current_user: CurrentUser = Depends(get_current_user_optional),
     ):
         """
         This endpoint performs a retrieval-augmented generation (RAG) query and streams the response.
 
+        Responses are NDJSON by default. Clients sending ``Accept: text/event-stream``
+        get the same payloads as Server-Sent Events, with keep-alive comments
+        while the stream is idle.
+
         Args:
             request (QueryRequest): The request object containing the query parameters.
             optional_api_key (Optional[str], optional): An optional API key for authentication. Defaults to None.
@@ -323,61 +492,158 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
         Returns:
             StreamingResponse: A streaming response containing the RAG query results.
         """
-        try:
-            param = request.to_query_params(True)
-            filters = build_access_filters(request.access_filters)
-
-            accessible_docs = await get_user_accessible_files(
-                rag.doc_status,
-                current_user,
-                project_id=filters.project_id,
-                include_shared=True,
-                include_public=True,
-                filters=filters,
-                required_permission=Permission.VIEW,
+        param, accessible_docs, _ = await scope_query_to_user(
+            request, current_user, is_stream=True
+        )
+
+        if not accessible_docs:
+            raise HTTPException(
+                status_code=403,
+                detail="No accessible documents found for the provided metadata filters.",
             )
-            
-            if not accessible_docs:
-                raise HTTPException(
-                    status_code=403,
-                    detail="No accessible documents found for the provided metadata filters.",
-                )
 
-            apply_doc_id_filter(param, accessible_docs)
-
-            logger.info(f"[query_text_stream] Invoking rag.aquery() with param.ids={param.ids}")
-            response = await rag.aquery(request.query, param=param)
-
-            async def stream_generator():
-                if isinstance(response, str):
-                    # If it's a string, send it all at once
-                    yield f"{json.dumps({'response': response})}\n"
-                elif response is None:
-                    # Handle None response (e.g., when only_need_context=True but no context found)
-                    yield f"{json.dumps({'response': 'No relevant context found for the query.'})}\n"
-                else:
-                    # If it's an async generator, send chunks one by one
-                    try:
-                        async for chunk in response:
-                            if chunk:  # Only send non-empty content
-                                yield f"{json.dumps({'response': chunk})}\n"
-                    except Exception as e:
-                        logging.error(f"Streaming error: {str(e)}")
-                        yield f"{json.dumps({'error': str(e)})}\n"
-
-            return StreamingResponse(
-                stream_generator(),
-                media_type="application/x-ndjson",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "Content-Type": "application/x-ndjson",
-                    "X-Accel-Buffering": "no",  # Ensure proper handling of streaming response when proxied by Nginx
-                },
+        logger.info(
+            "[query_text_stream] Invoking rag.aquery() with %s document ids",
+            "all" if param.ids is None else len(param.ids),
+        )
+        response = await rag.aquery(request.query, param=param)
+
+        use_sse = bool(accept) and "text/event-stream" in accept
+        encode = sse_event if use_sse else ndjson_line
+        media_type = "text/event-stream" if use_sse else "application/x-ndjson"
+
+        async def stream_generator():
+            if isinstance(response, str):
+                # If it's a string, send it all at once
+                yield encode({"response": response})
+            elif response is None:
+                # Handle None response (e.g., when only_need_context=True but no context found)
+                yield encode({"response": "No relevant context found for the query."})
+            else:
+                # If it's an async generator, batch chunks into fewer lines.
+                # The first chunk goes out at once to keep time-to-first-token low,
+                # and buffered text never waits longer than the flush window.
+                buffer: list[str] = []
+                buffered_chars = 0
+                last_flush = 0.0
+
+                def idle_timeout() -> Optional[float]:
+                    if buffer:
+                        return max(
+                            0.0, last_flush + STREAM_FLUSH_SECONDS - time.monotonic()
+                        )
+                    return SSE_PING_SECONDS if use_sse else None
+
+                try:
+                    async for chunk in with_idle_ticks(response, idle_timeout):
+                        if chunk is _IDLE:
+                            if buffer:
+                                yield encode({"response": "".join(buffer)})
+                                buffer.clear()
+                                buffered_chars = 0
+                                last_flush = time.monotonic()
+                            else:
+                                yield b": ping\n\n"
+                            continue
+                        if not chunk:  # Only send non-empty content
+                            continue
+                        buffer.append(chunk)
+                        buffered_chars += len(chunk)
+                        now = time.monotonic()
+                        if (
+                            buffered_chars >= STREAM_FLUSH_CHARS
+                            or now - last_flush >= STREAM_FLUSH_SECONDS
+                        ):
+                            yield encode({"response": "".join(buffer)})
+                            buffer.clear()
+                            buffered_chars = 0
+                            last_flush = now
+                except Exception as e:
+                    logging.error(f"Streaming error: {str(e)}")
+                    if buffer:
+                        yield encode({"response": "".join(buffer)})
+                        buffer.clear()
+                    yield encode({"error": str(e)})
+                if buffer:
+                    yield encode({"response": "".join(buffer)})
+
+        return StreamingResponse(
+            stream_generator(),
+            media_type=media_type,
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "Content-Type": media_type,
+                "X-Accel-Buffering": "no",  # Ensure proper handling of streaming response when proxied by Nginx
+            },
+        )
+
+    async def resolve_query_data(
+        request: QueryRequest, current_user: CurrentUser
+    ) -> dict[str, Any]:
+        """Run an access-scoped aquery_data and shape it like QueryDataResponse.
+
+        A plain dict is returned so the (trusted) retrieval results can be
+        serialized as-is, without a validation and jsonable_encoder pass.
+        """
+        # No streaming for data endpoint
+        param, accessible_docs, filters = await scope_query_to_user(
+            request, current_user, is_stream=False
+        )
+
+        if not accessible_docs:
+            raise HTTPException(
+                status_code=403,
+                detail="No accessible documents found for the provided metadata filters.",
             )
-        except Exception as e:
-            trace_exception(e)
-            raise HTTPException(status_code=500, detail=str(e))
+
+        logger.info(
+            "[query_data] Invoking rag.aquery_data() with %s document ids",
+            "all" if param.ids is None else len(param.ids),
+        )
+        response = await rag.aquery_data(request.query, param=param)
+
+        # The aquery_data method returns a dict with entities, relationships, chunks, and metadata
+        # No need to post-filter since filtering happens during retrieval via param.ids
+        if isinstance(response, dict):
+            # Results are already filtered by param.ids during retrieval
+            filtered_chunks = response.get("chunks", [])
+            filtered_entities = response.get("entities", [])
+            filtered_relationships = response.get("relationships", [])
+            metadata = response.get("metadata", {})
+
+            if not isinstance(filtered_entities, list):
+                filtered_entities = []
+            if not isinstance(filtered_relationships, list):
+                filtered_relationships = []
+            if not isinstance(filtered_chunks, list):
+                filtered_chunks = []
+            if not isinstance(metadata, dict):
+                metadata = {}
+
+            metadata["total_accessible_files"] = len(accessible_docs)
+            metadata["applied_filters"] = filters.as_dict()
+            if request.include_accessible_files:
+                metadata["accessible_files"] = list(
+                    filter(None, map(doc_file_path, accessible_docs.values()))
+                )
+
+            return {
+                "entities": filtered_entities,
+                "relationships": filtered_relationships,
+                "chunks": filtered_chunks,
+                "metadata": metadata,
+            }
+
+        return {
+            "entities": [],
+            "relationships": [],
+            "chunks": [],
+            "metadata": {
+                "error": "Unexpected response format",
+                "raw_response": str(response),
+            },
+        }
 
     @router.post(
         "/query/data",
@@ -399,84 +665,51 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
             request (QueryRequest): The request object containing the query parameters.
 
         Returns:
-            QueryDataResponse: A Pydantic model containing structured data with entities,
+            ORJSONResponse: A QueryDataResponse-shaped JSON body with entities,
                              relationships, chunks, and metadata.
 
         Raises:
             HTTPException: Raised when an error occurs during the request handling process,
                          with status code 500 and detail containing the exception message.
         """
-        try:
-            param = request.to_query_params(False)  # No streaming for data endpoint
-            filters = build_access_filters(request.access_filters)
-            accessible_docs = await get_user_accessible_files(
-                rag.doc_status,
-                current_user,
-                project_id=filters.project_id,
-                include_shared=True,
-                include_public=True,
-                filters=filters,
-                required_permission=Permission.VIEW,
-            )
-            
-            if not accessible_docs:
-                raise HTTPException(
-                    status_code=403,
-                    detail="No accessible documents found for the provided metadata filters.",
-                )
+        return ORJSONResponse(await resolve_query_data(request, current_user))
 
-            apply_doc_id_filter(param, accessible_docs)
-
-            logger.info(f"[query_data] Invoking rag.aquery_data() with param.ids={param.ids}")
-            response = await rag.aquery_data(request.query, param=param)
-
-            # The aquery_data method returns a dict with entities, relationships, chunks, and metadata
-            # No need to post-filter since filtering happens during retrieval via param.ids
-            if isinstance(response, dict):
-                # Results are already filtered by param.ids during retrieval
-                filtered_chunks = response.get("chunks", [])
-                filtered_entities = response.get("entities", [])
-                filtered_relationships = response.get("relationships", [])
-                metadata = response.get("metadata", {})
-
-                if not isinstance(filtered_entities, list):
-                    filtered_entities = []
-                if not isinstance(filtered_relationships, list):
-                    filtered_relationships = []
-                if not isinstance(filtered_chunks, list):
-                    filtered_chunks = []
-                if not isinstance(metadata, dict):
-                    metadata = {}
-
-                accessible_paths = [
-                    path for path in (doc_file_path(status) for status in accessible_docs.values()) if path
-                ]
-                metadata.update(
-                    {
-                        "accessible_files": accessible_paths,
-                        "total_accessible_files": len(accessible_docs),
-                        "applied_filters": filters.__dict__,
-                    }
-                )
+    @router.post("/query/data/stream", dependencies=[Depends(combined_auth)])
+    async def query_data_stream(
+        request: QueryRequest,
+        current_user: CurrentUser = Depends(get_current_user_optional),
+    ):
+        """
+        Retrieve structured data without LLM generation as NDJSON sections.
 
-                return QueryDataResponse(
-                    entities=filtered_entities,
-                    relationships=filtered_relationships,
-                    chunks=filtered_chunks,
-                    metadata=metadata,
-                )
+        Same retrieval as /query/data, but the result is streamed as four lines,
+        {"entities": [...]}, {"relationships": [...]}, {"chunks": [...]} and
+        {"metadata": {...}}. Retrieval still completes before the first line is
+        sent, so this does not lower time-to-first-byte; it lets clients parse
+        and act on each section separately and avoids encoding the whole result
+        into one buffer.
 
-            return QueryDataResponse(
-                entities=[],
-                relationships=[],
-                chunks=[],
-                metadata={
-                    "error": "Unexpected response format",
-                    "raw_response": str(response),
-                },
-            )
-        except Exception as e:
-            trace_exception(e)
-            raise HTTPException(status_code=500, detail=str(e))
+        Parameters:
+            request (QueryRequest): The request object containing the query parameters.
+
+        Returns:
+            StreamingResponse: NDJSON stream with one line per section.
+        """
+        result = await resolve_query_data(request, current_user)
+
+        async def stream_generator():
+            for section in ("entities", "relationships", "chunks", "metadata"):
+                yield ndjson_line({section: result[section]})
+
+        return StreamingResponse(
+            stream_generator(),
+            media_type="application/x-ndjson",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "Content-Type": "application/x-ndjson",
+                "X-Accel-Buffering": "no",  # Ensure proper handling of streaming response when proxied by Nginx
+            },
+        )
 
     return router
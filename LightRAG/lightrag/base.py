@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 from dataclasses import dataclass, field
 from typing import (
     Any,
+    AsyncIterator,
     Literal,
     TypedDict,
     TypeVar,
@@ -724,6 +725,7 @@ class BaseGraphStorage(StorageNameSpace, ABC):
         max_depth: int = 3,
         max_nodes: int = 1000,
         file_path: Optional[str] = None,
+        accessible_file_paths: Optional[frozenset[str]] = None,
     ) -> KnowledgeGraph:
         """
         Retrieve a connected subgraph of nodes where the label includes the specified `node_label`.
@@ -733,6 +735,11 @@ class BaseGraphStorage(StorageNameSpace, ABC):
             max_depth: Maximum depth of the subgraph, Defaults to 3
             max_nodes: Maxiumu nodes to return, Defaults to 1000（BFS if possible)
             file_path: Optional file path filter (supports partial matching)
+            accessible_file_paths: Optional access filter; nodes whose file_path
+                contains none of these paths are not returned and do not count
+                toward max_nodes. Nodes without a file_path are kept. Backends
+                that cannot apply it ignore it, so callers must still filter
+                the result.
 
         Returns:
             KnowledgeGraph object containing nodes and edges, with an is_truncated flag
@@ -816,6 +823,46 @@ class DocStatusStorage(BaseKVStorage, ABC):
     ) -> dict[str, DocProcessingStatus]:
         """Get all documents with a specific status"""
 
+    async def get_docs_by_status_iter(
+        self,
+        status: DocStatus,
+        project_id: str | None = None,
+        owner: str | None = None,
+        file_path_contains: str | None = None,
+    ) -> AsyncIterator[tuple[str, DocProcessingStatus]]:
+        """Yield (doc_id, status) pairs for documents with a specific status
+
+        Backends that can stream rows from their database should override this
+        so callers never hold the full result set. The default implementation
+        iterates over the result of get_docs_by_status.
+
+        Args:
+            status: Document status to select
+            project_id: Only yield documents whose metadata project_id matches
+            owner: Only yield documents whose metadata owner (or legacy
+                user_id) matches. Backends may return a superset here, so
+                callers that need an exact match should re-check it.
+            file_path_contains: Only yield documents whose file_path contains
+                this substring
+        """
+        docs = await self.get_docs_by_status(status)
+        for doc_id, doc_status in docs.items():
+            metadata = doc_status.metadata or {}
+            if project_id and metadata.get("project_id") != project_id:
+                continue
+            # Stored owners may be non-strings (e.g. numeric ids); access
+            # control compares their str() form, so this must too
+            if owner and not any(
+                value is not None and str(value) == owner
+                for value in (metadata.get("owner"), metadata.get("user_id"))
+            ):
+                continue
+            if file_path_contains and file_path_contains not in (
+                doc_status.file_path or ""
+            ):
+                continue
+            yield doc_id, doc_status
+
     @abstractmethod
     async def get_docs_by_track_id(
         self, track_id: str
@@ -862,6 +862,8 @@ class MemgraphStorage(BaseGraphStorage):
         node_label: str,
         max_depth: int = 3,
         max_nodes: int = None,
+        file_path: str | None = None,
+        accessible_file_paths: frozenset[str] | None = None,
     ) -> KnowledgeGraph:
         """
         Retrieve a connected subgraph of nodes where the label includes the specified `node_label`.
@@ -870,11 +872,18 @@ class MemgraphStorage(BaseGraphStorage):
             node_label: Label of the starting node, * means all nodes
             max_depth: Maximum depth of the subgraph, Defaults to 3
             max_nodes: Maximum nodes to return by BFS, Defaults to 1000
+            file_path: Optional file path filter (not yet implemented for Memgraph)
+            accessible_file_paths: Not applied by this backend; callers filter the result
 
         Returns:
             KnowledgeGraph object containing nodes and edges, with an is_truncated flag
             indicating whether the graph was truncated due to max_nodes limit
         """
+        if file_path:
+            logger.warning(
+                f"[{self.workspace}] Memgraph file_path filtering not yet implemented, ignoring filter: {file_path}"
+            )
+
         # Get max_nodes from global_config if not provided
         if max_nodes is None:
             max_nodes = self.global_config.get("max_graph_nodes", 1000)
@@ -1,11 +1,12 @@
 import os
+import re
 import time
 from dataclasses import dataclass, field
 import numpy as np
 import configparser
 import asyncio
 
-from typing import Any, Union, final, Optional
+from typing import Any, AsyncIterator, Union, final, Optional
 
 from ..base import (
     BaseGraphStorage,
@@ -422,6 +423,35 @@ class MongoDocStatusStorage(DocStatusStorage):
                 continue
         return processed_result
 
+    async def get_docs_by_status_iter(
+        self,
+        status: DocStatus,
+        project_id: str | None = None,
+        owner: str | None = None,
+        file_path_contains: str | None = None,
+    ) -> AsyncIterator[tuple[str, DocProcessingStatus]]:
+        """Stream documents with a specific status from the cursor
+
+        owner is not pushed down: stored owners may be non-strings (e.g.
+        numeric ids) that access control matches by their str() form, which a
+        plain equality filter would miss. Callers re-check the owner.
+        """
+        query_filter: dict[str, Any] = {"status": status.value}
+        if project_id:
+            query_filter["metadata.project_id"] = project_id
+        if file_path_contains:
+            query_filter["file_path"] = {"$regex": re.escape(file_path_contains)}
+        cursor = self._data.find(query_filter)
+        async for doc in cursor:
+            try:
+                data = self._prepare_doc_status_data(doc)
+                yield doc["_id"], DocProcessingStatus(**data)
+            except KeyError as e:
+                logger.error(
+                    f"[{self.workspace}] Missing required field for document {doc['_id']}: {e}"
+                )
+                continue
+
     async def get_docs_by_track_id(
         self, track_id: str
     ) -> dict[str, DocProcessingStatus]:
@@ -1443,6 +1473,7 @@ class MongoGraphStorage(BaseGraphStorage):
         max_depth: int = 3,
         max_nodes: int = None,
         file_path: Optional[str] = None,
+        accessible_file_paths: Optional[frozenset[str]] = None,
     ) -> KnowledgeGraph:
         """
         Retrieve a connected subgraph of nodes where the label includes the specified `node_label`.
@@ -1452,6 +1483,7 @@ class MongoGraphStorage(BaseGraphStorage):
             max_depth: Maximum depth of the subgraph, Defaults to 3
             max_nodes: Maximum nodes to return, Defaults to global_config max_graph_nodes
             file_path: Optional file path filter (supports partial matching)
+            accessible_file_paths: Not applied by this backend; callers filter the result
 
         Returns:
             KnowledgeGraph object containing nodes and edges, with an is_truncated flag
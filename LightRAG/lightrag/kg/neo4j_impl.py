@@ -962,6 +962,7 @@ class Neo4JStorage(BaseGraphStorage):
         max_depth: int = 3,
         max_nodes: int = None,
         file_path: Optional[str] = None,
+        accessible_file_paths: Optional[frozenset[str]] = None,
     ) -> KnowledgeGraph:
         """
         Retrieve a connected subgraph of nodes where the label includes the specified `node_label`.
@@ -971,6 +972,7 @@ class Neo4JStorage(BaseGraphStorage):
             max_depth: Maximum depth of the subgraph, Defaults to 3
             max_nodes: Maxiumu nodes to return by BFS, Defaults to 1000
             file_path: Optional file path filter (supports partial matching)
+            accessible_file_paths: Not applied by this backend; callers filter the result
 
         Returns:
             KnowledgeGraph object containing nodes and edges, with an is_truncated flag
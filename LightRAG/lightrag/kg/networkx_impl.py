@@ -1,9 +1,10 @@
 import os
+from collections import deque
 from dataclasses import dataclass
-from typing import final, Optional
+from typing import Callable, final, Optional
 
 from lightrag.types import KnowledgeGraph, KnowledgeGraphNode, KnowledgeGraphEdge
-from lightrag.utils import logger
+from lightrag.utils import logger, substring_alternation
 from lightrag.base import BaseGraphStorage
 from lightrag.constants import GRAPH_FIELD_SEP
 import networkx as nx
@@ -21,6 +22,27 @@ from dotenv import load_dotenv
 load_dotenv(dotenv_path=".env", override=False)
 
 
+def _accessible_node_predicate(
+    accessible_file_paths: frozenset[str],
+) -> Callable[[dict], bool]:
+    """Build a node-data check for get_knowledge_graph access filtering
+
+    A node passes when it has no file_path or when its file_path contains any
+    of the accessible paths (substring match, as in the API access filter).
+    """
+    pattern = (
+        substring_alternation(accessible_file_paths) if accessible_file_paths else None
+    )
+
+    def node_allowed(node_data: dict) -> bool:
+        node_file_path = node_data.get("file_path")
+        if not node_file_path:
+            return True
+        return pattern is not None and pattern.search(node_file_path) is not None
+
+    return node_allowed
+
+
 @final
 @dataclass
 class NetworkXStorage(BaseGraphStorage):
@@ -218,6 +240,7 @@ class NetworkXStorage(BaseGraphStorage):
         max_depth: int = 3,
         max_nodes: int = None,
         file_path: Optional[str] = None,
+        accessible_file_paths: Optional[frozenset[str]] = None,
     ) -> KnowledgeGraph:
         """
         Retrieve a connected subgraph of nodes where the label includes the specified `node_label`.
@@ -227,6 +250,9 @@ class NetworkXStorage(BaseGraphStorage):
             max_depth: Maximum depth of the subgraph, Defaults to 3
             max_nodes: Maxiumu nodes to return by BFS, Defaults to 1000
             file_path: Optional file path filter (supports partial matching)
+            accessible_file_paths: Optional access filter applied during traversal;
+                inaccessible nodes are still traversed but are neither returned
+                nor counted toward max_nodes
 
         Returns:
             KnowledgeGraph object containing nodes and edges, with an is_truncated flag
@@ -243,10 +269,20 @@ class NetworkXStorage(BaseGraphStorage):
 
         result = KnowledgeGraph()
 
+        node_allowed = None
+        if accessible_file_paths is not None:
+            node_allowed = _accessible_node_predicate(accessible_file_paths)
+
         # Handle special case for "*" label
         if node_label == "*":
             # Get degrees of all nodes
             degrees = dict(graph.degree())
+            if node_allowed is not None:
+                degrees = {
+                    node: degree
+                    for node, degree in degrees.items()
+                    if node_allowed(graph.nodes[node])
+                }
             # Sort nodes by degree in descending order and take top max_nodes
             sorted_nodes = sorted(degrees.items(), key=lambda x: x[1], reverse=True)
 
@@ -270,9 +306,10 @@ class NetworkXStorage(BaseGraphStorage):
 
             # Use modified BFS to get nodes, prioritizing high-degree nodes at the same depth
             bfs_nodes = []
-            visited = set()
+            # Nodes are marked visited when enqueued, so each is queued once
+            visited = {node_label}
             # Store (node, depth, degree) in the queue
-            queue = [(node_label, 0, graph.degree(node_label))]
+            queue = deque([(node_label, 0, graph.degree(node_label))])
 
             # Modified breadth-first search with degree-based prioritization
             while queue and len(bfs_nodes) < max_nodes:
@@ -282,29 +319,29 @@ class NetworkXStorage(BaseGraphStorage):
                 # Collect all nodes at the current depth
                 current_level_nodes = []
                 while queue and queue[0][1] == current_depth:
-                    current_level_nodes.append(queue.pop(0))
+                    current_level_nodes.append(queue.popleft())
 
                 # Sort nodes at current depth by degree (highest first)
                 current_level_nodes.sort(key=lambda x: x[2], reverse=True)
 
                 # Process all nodes at current depth in order of degree
                 for current_node, depth, degree in current_level_nodes:
-                    if current_node not in visited:
-                        visited.add(current_node)
+                    # Inaccessible nodes are traversed but neither returned
+                    # nor counted toward max_nodes
+                    if node_allowed is None or node_allowed(
+                        graph.nodes[current_node]
+                    ):
                         bfs_nodes.append(current_node)
 
-                        # Only explore neighbors if we haven't reached max_depth
-                        if depth < max_depth:
-                            # Add neighbor nodes to queue with incremented depth
-                            neighbors = list(graph.neighbors(current_node))
-                            # Filter out already visited neighbors
-                            unvisited_neighbors = [
-                                n for n in neighbors if n not in visited
-                            ]
-                            # Add neighbors to the queue with their degrees
-                            for neighbor in unvisited_neighbors:
-                                neighbor_degree = graph.degree(neighbor)
-                                queue.append((neighbor, depth + 1, neighbor_degree))
+                    # Only explore neighbors if we haven't reached max_depth
+                    if depth < max_depth:
+                        # Add unvisited neighbors to queue with incremented depth
+                        for neighbor in graph.neighbors(current_node):
+                            if neighbor not in visited:
+                                visited.add(neighbor)
+                                queue.append(
+                                    (neighbor, depth + 1, graph.degree(neighbor))
+                                )
 
                     # Check if we've reached max_nodes
                     if len(bfs_nodes) >= max_nodes:
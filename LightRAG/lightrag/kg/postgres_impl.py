@@ -5,7 +5,7 @@ import re
 import datetime
 from datetime import timezone
 from dataclasses import dataclass, field
-from typing import Any, Union, final, Optional
+from typing import Any, AsyncIterator, Union, final, Optional
 import numpy as np
 import configparser
 import ssl
@@ -738,6 +738,18 @@ class PostgreSQLDB:
                 f"Failed to add metadata/error_msg columns to LIGHTRAG_DOC_STATUS: {e}"
             )
 
+        try:
+            # Index metadata project_id so access filtering can push it down
+            create_project_index_sql = """
+            CREATE INDEX IF NOT EXISTS idx_lightrag_doc_status_metadata_project_id
+            ON LIGHTRAG_DOC_STATUS (workspace, (metadata->>'project_id'))
+            """
+            await self.execute(create_project_index_sql)
+        except Exception as e:
+            logger.warning(
+                f"Failed to create metadata project_id index on LIGHTRAG_DOC_STATUS: {e}"
+            )
+
     async def _migrate_field_lengths(self):
         """Migrate database field lengths: entity_name, source_id, target_id, and file_path"""
         # Define the field changes needed
@@ -2410,6 +2422,50 @@ class PGDocStatusStorage(DocStatusStorage):
             counts[doc["status"]] = doc["count"]
         return counts
 
+    def _doc_status_from_row(self, element: dict[str, Any]) -> DocProcessingStatus:
+        """Build a DocProcessingStatus from a LIGHTRAG_DOC_STATUS row"""
+        # Parse chunks_list JSON string back to list
+        chunks_list = element.get("chunks_list", [])
+        if isinstance(chunks_list, str):
+            try:
+                chunks_list = json.loads(chunks_list)
+            except json.JSONDecodeError:
+                chunks_list = []
+
+        # Parse metadata JSON string back to dict
+        metadata = element.get("metadata", {})
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except json.JSONDecodeError:
+                metadata = {}
+        # Ensure metadata is a dict
+        if not isinstance(metadata, dict):
+            metadata = {}
+
+        # Safe handling for file_path
+        file_path = element.get("file_path")
+        if file_path is None:
+            file_path = "no-file-path"
+
+        # Convert datetime objects to ISO format strings with timezone info
+        created_at = self._format_datetime_with_timezone(element["created_at"])
+        updated_at = self._format_datetime_with_timezone(element["updated_at"])
+
+        return DocProcessingStatus(
+            content_summary=element["content_summary"],
+            content_length=element["content_length"],
+            status=element["status"],
+            created_at=created_at,
+            updated_at=updated_at,
+            chunks_count=element["chunks_count"],
+            file_path=file_path,
+            chunks_list=chunks_list,
+            metadata=metadata,
+            error_msg=element.get("error_msg"),
+            track_id=element.get("track_id"),
+        )
+
     async def get_docs_by_status(
         self, status: DocStatus
     ) -> dict[str, DocProcessingStatus]:
@@ -2420,49 +2476,63 @@ class PGDocStatusStorage(DocStatusStorage):
 
         docs_by_status = {}
         for element in result:
-            # Parse chunks_list JSON string back to list
-            chunks_list = element.get("chunks_list", [])
-            if isinstance(chunks_list, str):
-                try:
-                    chunks_list = json.loads(chunks_list)
-                except json.JSONDecodeError:
-                    chunks_list = []
+            docs_by_status[element["id"]] = self._doc_status_from_row(element)
 
-            # Parse metadata JSON string back to dict
-            metadata = element.get("metadata", {})
-            if isinstance(metadata, str):
-                try:
-                    metadata = json.loads(metadata)
-                except json.JSONDecodeError:
-                    metadata = {}
-            # Ensure metadata is a dict
-            if not isinstance(metadata, dict):
-                metadata = {}
+        return docs_by_status
 
-            # Safe handling for file_path
-            file_path = element.get("file_path")
-            if file_path is None:
-                file_path = "no-file-path"
+    async def get_docs_by_status_iter(
+        self,
+        status: DocStatus,
+        project_id: str | None = None,
+        owner: str | None = None,
+        file_path_contains: str | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[tuple[str, DocProcessingStatus]]:
+        """Documents with a specific status, filtered on metadata in SQL
+
+        Rows are fetched in pages of batch_size using keyset pagination on id
+        (covered by the (workspace, id) primary key), so at most one page is
+        held in memory at a time.
+        """
+        sql = "select * from LIGHTRAG_DOC_STATUS where workspace=$1 and status=$2"
+        params = {"workspace": self.workspace, "status": status.value}
+        if project_id:
+            params["project_id"] = project_id
+            sql += f" and metadata->>'project_id'=${len(params)}"
+        if owner:
+            params["owner"] = owner
+            sql += (
+                f" and (metadata->>'owner'=${len(params)}"
+                f" or metadata->>'user_id'=${len(params)})"
+            )
+        if file_path_contains:
+            params["file_path_contains"] = file_path_contains
+            sql += f" and strpos(file_path, ${len(params)}) > 0"
+        values = list(params.values())
+        first_page_sql = f"{sql} order by id limit ${len(values) + 1}"
+        next_page_sql = (
+            f"{sql} and id > ${len(values) + 1} order by id limit ${len(values) + 2}"
+        )
 
-            # Convert datetime objects to ISO format strings with timezone info
-            created_at = self._format_datetime_with_timezone(element["created_at"])
-            updated_at = self._format_datetime_with_timezone(element["updated_at"])
+        last_id = None
+        while True:
+            if last_id is None:
+                result = await self.db.query(
+                    first_page_sql, values + [batch_size], True
+                )
+            else:
+                result = await self.db.query(
+                    next_page_sql, values + [last_id, batch_size], True
+                )
+            if not result:
+                return
 
-            docs_by_status[element["id"]] = DocProcessingStatus(
-                content_summary=element["content_summary"],
-                content_length=element["content_length"],
-                status=element["status"],
-                created_at=created_at,
-                updated_at=updated_at,
-                chunks_count=element["chunks_count"],
-                file_path=file_path,
-                chunks_list=chunks_list,
-                metadata=metadata,
-                error_msg=element.get("error_msg"),
-                track_id=element.get("track_id"),
-            )
+            for element in result:
+                yield element["id"], self._doc_status_from_row(element)
 
-        return docs_by_status
+            if len(result) < batch_size:
+                return
+            last_id = result[-1]["id"]
 
     async def get_docs_by_track_id(
         self, track_id: str
@@ -4090,6 +4160,7 @@ class PGGraphStorage(BaseGraphStorage):
         max_depth: int = 3,
         max_nodes: int = None,
         file_path: Optional[str] = None,
+        accessible_file_paths: Optional[frozenset[str]] = None,
     ) -> KnowledgeGraph:
         """
         Retrieve a connected subgraph of nodes where the label includes the specified `node_label`.
@@ -4099,6 +4170,7 @@ class PGGraphStorage(BaseGraphStorage):
             max_depth: Maximum depth of the subgraph, Defaults to 3
             max_nodes: Maximum nodes to return, Defaults to global_config max_graph_nodes
             file_path: Optional file path filter (supports partial matching)
+            accessible_file_paths: Not applied by this backend; callers filter the result
 
         Returns:
             KnowledgeGraph object containing nodes and edges, with an is_truncated flag
@@ -821,6 +821,7 @@ class LightRAG:
         max_depth: int = 3,
         max_nodes: int = None,
         file_path: Optional[str] = None,
+        accessible_file_paths: Optional[frozenset[str]] = None,
     ) -> KnowledgeGraph:
         """Get knowledge graph for a given label
 
@@ -829,6 +830,8 @@ class LightRAG:
             max_depth (int): Maximum depth of graph
             max_nodes (int, optional): Maximum number of nodes to return. Defaults to self.max_graph_nodes.
             file_path (str, optional): Filter by source file path (supports partial matching)
+            accessible_file_paths (frozenset[str], optional): Only traverse nodes whose
+                source file path contains one of these paths, where the storage supports it
 
         Returns:
             KnowledgeGraph: Knowledge graph containing nodes and edges
@@ -841,7 +844,11 @@ class LightRAG:
             max_nodes = min(max_nodes, self.max_graph_nodes)
 
         return await self.chunk_entity_relation_graph.get_knowledge_graph(
-            node_label, max_depth, max_nodes, file_path
+            node_label,
+            max_depth,
+            max_nodes,
+            file_path,
+            accessible_file_paths=accessible_file_paths,
         )
 
     def _get_storage_class(self, storage_name: str) -> Callable[..., Any]:
@@ -126,6 +126,23 @@ async def _get_chunk_ids_for_doc_ids(
     return allowed_chunk_ids
 
 
+def _from_allowed_chunks(record: dict, filter_chunk_ids: set[str] | None) -> bool:
+    """
+    Check whether a graph node or edge was extracted from an allowed chunk.
+
+    Records reached by graph traversal (neighbour edges of matched entities,
+    endpoints of matched relations) bypass the vector-store filter, so they are
+    checked here against the same chunk ID set before being ranked or returned.
+    No filter means every record is allowed.
+    """
+    if not filter_chunk_ids:
+        return True
+    source_id = record.get("source_id")
+    if not source_id:
+        return False
+    return not filter_chunk_ids.isdisjoint(source_id.split(GRAPH_FIELD_SEP))
+
+
 def chunking_by_token_size(
     tokenizer: Tokenizer,
     content: str,
@@ -3635,6 +3652,7 @@ async def _get_node_data(
         node_datas,
         query_param,
         knowledge_graph_inst,
+        filter_chunk_ids,
     )
 
     logger.info(
@@ -3650,6 +3668,7 @@ async def _find_most_related_edges_from_entities(
     node_datas: list[dict],
     query_param: QueryParam,
     knowledge_graph_inst: BaseGraphStorage,
+    filter_chunk_ids: set[str] | None = None,
 ):
     node_names = [dp["entity_name"] for dp in node_datas]
     batch_edges_dict = await knowledge_graph_inst.get_nodes_edges_batch(node_names)
@@ -3682,6 +3701,8 @@ async def _find_most_related_edges_from_entities(
     for pair in all_edges:
         edge_props = edge_data_dict.get(pair)
         if edge_props is not None:
+            if not _from_allowed_chunks(edge_props, filter_chunk_ids):
+                continue
             if "weight" not in edge_props:
                 logger.warning(
                     f"Edge {pair} missing 'weight' attribute, using default value 1.0"
@@ -3913,6 +3934,7 @@ async def _get_edge_data(
         edge_datas,
         query_param,
         knowledge_graph_inst,
+        filter_chunk_ids,
     )
 
     logger.info(
@@ -3926,6 +3948,7 @@ async def _find_most_related_entities_from_relationships(
     edge_datas: list[dict],
     query_param: QueryParam,
     knowledge_graph_inst: BaseGraphStorage,
+    filter_chunk_ids: set[str] | None = None,
 ):
     entity_names = []
     seen = set()
@@ -3948,6 +3971,8 @@ async def _find_most_related_entities_from_relationships(
         if node is None:
             logger.warning(f"Node '{entity_name}' not found in batch retrieval.")
             continue
+        if not _from_allowed_chunks(node, filter_chunk_ids):
+            continue
         # Combine the node data with the entity name, no rank needed
         combined = {**node, "entity_name": entity_name}
         node_datas.append(combined)
@@ -13,7 +13,7 @@ import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from hashlib import md5
 from typing import Any, Protocol, Callable, TYPE_CHECKING, List, Optional
 import numpy as np
@@ -1035,6 +1035,18 @@ def split_string_by_multi_markers(content: str, markers: list[str]) -> list[str]
     return [r.strip() for r in results if r.strip()]
 
 
+@lru_cache(maxsize=64)
+def substring_alternation(needles: frozenset[str]) -> re.Pattern[str]:
+    """Compile one cached alternation that finds any of needles in a string.
+
+    Longest needles come first so the engine settles on full matches early; the
+    scan runs in C instead of one Python-level ``in`` per needle. An empty set
+    compiles to a pattern that matches everything, so callers must handle it.
+    """
+    ordered = sorted(needles, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, ordered)))
+
+
 def is_float_regex(value: str) -> bool:
     return bool(re.match(r"^[-+]?[0-9]*\.?[0-9]+$", value))
 
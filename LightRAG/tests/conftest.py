@@ -0,0 +1,9 @@
+"""
+Shared pytest setup for the LightRAG API tests.
+"""
+
+import sys
+
+# lightrag.api.config parses sys.argv on import; keep pytest's own arguments
+# away from the server's argument parser
+sys.argv = sys.argv[:1]
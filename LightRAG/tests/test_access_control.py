@@ -0,0 +1,30 @@
+"""
+Unit tests for access-control metadata handling.
+"""
+
+from lightrag.api.access_control import CurrentUser, Permission, ShareEntry
+from lightrag.api.routers.document_routes import build_access_metadata
+
+
+def test_share_entry_coerces_numeric_identifier():
+    entry = ShareEntry(target_type="user", permission=Permission.EDIT, identifier=42)
+
+    assert entry.identifier == "42"
+    assert entry.as_string() == "user:edit:42"
+    assert entry.matches_user("42", ())
+
+
+def test_build_access_metadata_with_numeric_user_id():
+    user = CurrentUser(username="alice", user_id=42, is_authenticated=True)
+
+    metadata = build_access_metadata(
+        current_user=user,
+        project_id=None,
+        is_public=False,
+        raw_tags=None,
+        raw_share=None,
+        owner=None,
+    )
+
+    assert metadata["owner"] == 42
+    assert metadata["share"] == ["user:edit:42"]